@@ -2,42 +2,171 @@
 Audio Speech Recognition module for MediSynth Agent.
 
 This module handles audio input processing and speech-to-text conversion
-using OpenAI Whisper for high-quality medical transcription.
+using faster-whisper (CTranslate2) for high-quality medical transcription.
 """
 
 import asyncio
+import functools
 import io
-import tempfile
+import multiprocessing
+import os
+import subprocess
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, List, Optional, Tuple, Union
 
-import librosa
 import numpy as np
-import soundfile as sf
-import whisper
-from pydub import AudioSegment
+
+from config import Config
+
+# faster-whisper (CTranslate2), soundfile and soxr are imported where they
+# are used so importing this package stays cheap
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_whisper(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int = 0
+) -> Tuple["WhisperModel", threading.Lock]:
+    """
+    Load a Whisper model once per process and share it across processors.
+    
+    Args:
+        model_size: Whisper model size
+        device: Device to run inference on
+        compute_type: CTranslate2 weight/compute precision (e.g. "int8", "float16")
+        cpu_threads: CTranslate2 threads per model; 0 keeps the library default
+        
+    Returns:
+        Tuple of the loaded model and the lock guarding its transcribe calls
+    """
+    from faster_whisper import WhisperModel
+    
+    model = WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads
+    )
+    return model, threading.Lock()
+
+
+# Per-worker processor used by the transcription process pool
+_WORKER_PROCESSOR = None
+
+
+def _init_worker(processor_kwargs: Tuple[Tuple[str, Any], ...], cpu_queue) -> None:
+    """
+    Pin a pool worker to one CPU and load its own single-threaded Whisper model.
+    
+    Args:
+        processor_kwargs: ASRProcessor keyword arguments as (name, value) pairs
+        cpu_queue: Queue of CPU ids, one taken per worker
+    """
+    global _WORKER_PROCESSOR
+    
+    cpu_id = cpu_queue.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu_id})
+    
+    _WORKER_PROCESSOR = ASRProcessor(**dict(processor_kwargs), cpu_threads=1)
+
+
+def _transcribe_in_worker(
+    audio_data: Union[str, bytes, np.ndarray],
+    language: Optional[str],
+    task: str
+) -> dict:
+    """Transcribe audio with the worker-local processor."""
+    return _WORKER_PROCESSOR.transcribe(audio_data, language=language, task=task)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_process_executor(
+    processor_kwargs: Tuple[Tuple[str, Any], ...]
+) -> ProcessPoolExecutor:
+    """
+    Create the transcription process pool for a processor configuration once.
+    
+    Args:
+        processor_kwargs: ASRProcessor keyword arguments as (name, value) pairs
+        
+    Returns:
+        Process pool whose workers each hold a pinned Whisper model
+    """
+    max_workers = max(1, Config.ASR_MAX_CONCURRENT_JOBS)
+    
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    
+    # Spawn rather than fork: the parent already runs CTranslate2 threads
+    # (and possibly CUDA), neither of which survives a fork
+    context = multiprocessing.get_context("spawn")
+    cpu_queue = context.Queue()
+    for worker_index in range(max_workers):
+        cpu_queue.put(cpus[worker_index % len(cpus)])
+    
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(processor_kwargs, cpu_queue)
+    )
 
 
 class ASRProcessor:
-    """Audio Speech Recognition processor using OpenAI Whisper."""
+    """Audio Speech Recognition processor using faster-whisper."""
     
-    def __init__(self, model_size: str = "base", device: str = "cpu"):
+    def __init__(
+        self,
+        model_size: str = "base",
+        device: str = "cpu",
+        vad_filter: bool = True,
+        vad_min_silence_ms: int = 500,
+        compute_type: Optional[str] = None,
+        cpu_threads: int = 0
+    ):
         """
         Initialize the ASR processor.
         
         Args:
             model_size: Whisper model size ("tiny", "base", "small", "medium", "large")
             device: Device to run inference on ("cpu" or "cuda")
+            vad_filter: Skip non-speech audio with Silero VAD before decoding
+            vad_min_silence_ms: Shortest silence (ms) the VAD cuts out
+            compute_type: Weight precision; None quantizes to int8 on CPU and
+                float16 on CUDA, "float32" opts out for quality-critical use
+            cpu_threads: CTranslate2 threads for the model; 0 keeps the library default
         """
+        if compute_type is None:
+            compute_type = "int8" if device == "cpu" else "float16"
+        
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.vad_filter = vad_filter
+        self.vad_min_silence_ms = vad_min_silence_ms
+        self.vad_parameters = {"min_silence_duration_ms": vad_min_silence_ms}
         self.model = None
+        self._model_lock = None
+        self._batched_pipeline = None
+        self._preprocess = self._build_preprocess(target_sr=16000)
         self._load_model()
     
     def _load_model(self) -> None:
-        """Load the Whisper model."""
+        """Load the quantized Whisper model, reusing cached weights."""
         try:
-            self.model = whisper.load_model(self.model_size, device=self.device)
+            self.model, self._model_lock = _cached_whisper(
+                self.model_size, self.device, self.compute_type, self.cpu_threads
+            )
             print(f"Loaded Whisper model: {self.model_size}")
         except Exception as e:
             print(f"Error loading Whisper model: {e}")
@@ -61,40 +190,128 @@ class ASRProcessor:
         try:
             if isinstance(audio_data, str):
                 # Load from file path
-                audio, sr = librosa.load(audio_data, sr=target_sr)
+                audio = self._load_audio_file(audio_data, target_sr)
             elif isinstance(audio_data, bytes):
-                # Load from bytes
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                    tmp_file.write(audio_data)
-                    tmp_file.flush()
-                    audio, sr = librosa.load(tmp_file.name, sr=target_sr)
-                Path(tmp_file.name).unlink()  # Clean up temp file
+                # Load from bytes in memory; fall back to ffmpeg for
+                # compressed formats libsndfile cannot decode (mp3/m4a)
+                import soundfile as sf
+                
+                try:
+                    audio = self._load_audio_file(io.BytesIO(audio_data), target_sr)
+                except sf.LibsndfileError:
+                    audio = self._decode_with_ffmpeg(audio_data, target_sr)
             elif isinstance(audio_data, np.ndarray):
-                audio = audio_data
-                sr = target_sr
+                # Copy so in-place normalization never touches caller data
+                audio = audio_data.astype(np.float32)
             else:
                 raise ValueError("Unsupported audio data type")
             
-            # Normalize audio
-            audio = librosa.util.normalize(audio)
-            
-            # Ensure audio is mono
-            if len(audio.shape) > 1:
-                audio = librosa.to_mono(audio)
+            # Ensure audio is mono first (soundfile layout is frames x channels)
+            # so normalization only traverses a single channel
+            if audio.ndim > 1:
+                audio = audio.mean(axis=1, dtype=np.float32)
             
-            return audio
+            return self._normalize_peak(audio)
             
         except Exception as e:
             print(f"Error preprocessing audio: {e}")
             raise
     
+    @staticmethod
+    def _normalize_peak(audio: np.ndarray) -> np.ndarray:
+        """Peak-normalize mono float32 audio in place and return it."""
+        peak = np.abs(audio).max() if audio.size else 0.0
+        if peak > 0:
+            np.multiply(audio, 1.0 / peak, out=audio)
+        
+        return audio
+    
+    def _build_preprocess(self, target_sr: int = 16000):
+        """
+        Build a preprocess callable specialized for the transcription path.
+        
+        Used by transcribe and transcribe_batch. Mono float32 arrays passed
+        to them skip the type dispatch and downmix checks and go straight
+        to normalization (arrays are never resampled, so they must already
+        be at target_sr); paths, bytes such as the recorder's raw int16
+        frames, and other arrays fall back to preprocess_audio.
+        
+        Args:
+            target_sr: Sample rate the transcription path runs at
+            
+        Returns:
+            Callable mapping audio input to preprocessed audio
+        """
+        generic = functools.partial(self.preprocess_audio, target_sr=target_sr)
+        normalize = self._normalize_peak
+        
+        def preprocess(audio_data):
+            if (
+                type(audio_data) is np.ndarray
+                and audio_data.ndim == 1
+                and audio_data.dtype == np.float32
+            ):
+                return normalize(audio_data.copy())
+            return generic(audio_data)
+        
+        return preprocess
+    
+    @staticmethod
+    def _load_audio_file(source, target_sr: int) -> np.ndarray:
+        """
+        Decode audio as float32 and resample it to the target rate.
+        
+        Args:
+            source: Audio file path or file-like object readable by soundfile
+            target_sr: Target sample rate
+            
+        Returns:
+            Decoded audio as a float32 numpy array
+        """
+        import soundfile as sf
+        
+        audio, sr = sf.read(source, dtype='float32', always_2d=False)
+        
+        if sr != target_sr:
+            import soxr
+            
+            audio = soxr.resample(audio, sr, target_sr).astype(np.float32, copy=False)
+        
+        return audio
+    
+    @staticmethod
+    def _decode_with_ffmpeg(audio_data: bytes, target_sr: int) -> np.ndarray:
+        """
+        Decode arbitrary encoded audio bytes to mono float32 PCM via ffmpeg pipes.
+        
+        Args:
+            audio_data: Encoded audio bytes
+            target_sr: Target sample rate
+            
+        Returns:
+            Decoded audio as a float32 numpy array
+        """
+        result = subprocess.run(
+            [
+                "ffmpeg", "-nostdin", "-i", "pipe:0",
+                "-f", "f32le", "-ac", "1", "-ar", str(target_sr),
+                "pipe:1"
+            ],
+            input=audio_data,
+            capture_output=True,
+            check=True
+        )
+        
+        # Copy out of the immutable bytes buffer so callers can modify in place
+        return np.frombuffer(result.stdout, dtype=np.float32).copy()
+    
     def convert_audio_format(
         self, 
         input_path: str, 
         output_format: str = "wav"
     ) -> str:
         """
-        Convert audio file to specified format.
+        Convert audio file to specified format as 16kHz mono.
         
         Args:
             input_path: Path to input audio file
@@ -104,14 +321,25 @@ class ASRProcessor:
             Path to converted audio file
         """
         try:
-            audio = AudioSegment.from_file(input_path)
-            
             # Create output path
             input_path_obj = Path(input_path)
             output_path = input_path_obj.with_suffix(f'.{output_format}')
             
-            # Export in target format
-            audio.export(str(output_path), format=output_format)
+            # ffmpeg cannot write over its own input, so go via a sibling file
+            target_path = output_path
+            if output_path == input_path_obj:
+                target_path = output_path.with_name(f"{output_path.stem}.converted{output_path.suffix}")
+            
+            # Transcode with ffmpeg directly, at the 16kHz mono Whisper expects
+            command = ["ffmpeg", "-y", "-nostdin", "-i", input_path, "-ar", "16000", "-ac", "1"]
+            if output_format == "wav":
+                command += ["-c:a", "pcm_s16le"]
+            command.append(str(target_path))
+            
+            subprocess.run(command, check=True, capture_output=True)
+            
+            if target_path != output_path:
+                target_path.replace(output_path)
             
             return str(output_path)
             
@@ -136,23 +364,19 @@ class ASRProcessor:
         Returns:
             Dictionary with transcription results
         """
-        def _transcribe():
-            # Preprocess audio
-            audio = self.preprocess_audio(audio_data)
-            
-            # Transcribe using Whisper
-            result = self.model.transcribe(
-                audio,
-                language=language,
-                task=task,
-                verbose=False
-            )
-            
-            return result
-        
-        # Run transcription in thread pool to avoid blocking
+        # Run transcription in worker processes so concurrent calls are
+        # not serialized on the GIL
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, _transcribe)
+        executor = _get_process_executor((
+            ("model_size", self.model_size),
+            ("device", self.device),
+            ("vad_filter", self.vad_filter),
+            ("vad_min_silence_ms", self.vad_min_silence_ms),
+            ("compute_type", self.compute_type)
+        ))
+        result = await loop.run_in_executor(
+            executor, _transcribe_in_worker, audio_data, language, task
+        )
         
         return result
     
@@ -174,39 +398,232 @@ class ASRProcessor:
             Dictionary with transcription results
         """
         # Preprocess audio
-        audio = self.preprocess_audio(audio_data)
-        
-        # Transcribe using Whisper
-        result = self.model.transcribe(
-            audio,
-            language=language,
-            task=task,
-            verbose=False
+        audio = self._preprocess(audio_data)
+        
+        return self._transcribe_preprocessed(audio, language, task)
+    
+    def _transcribe_preprocessed(
+        self,
+        audio: np.ndarray,
+        language: Optional[str] = None,
+        task: str = "transcribe"
+    ) -> dict:
+        """
+        Transcribe audio that has already been through preprocess_audio.
+        
+        Args:
+            audio: Preprocessed mono float32 audio
+            language: Language code (e.g., "en", "es") or None for auto-detection
+            task: "transcribe" or "translate"
+            
+        Returns:
+            Dictionary with transcription results
+        """
+        # Transcribe using Whisper; the shared model is not reentrant and
+        # segments are yielded lazily, so materialize them under the lock.
+        # VAD drops silent stretches and segment times stay in original time.
+        with self._model_lock:
+            segments, info = self.model.transcribe(
+                audio,
+                language=language,
+                task=task,
+                beam_size=1,
+                vad_filter=self.vad_filter,
+                vad_parameters=self.vad_parameters
+            )
+            
+            return self._build_result(segments, info)
+    
+    async def stream_transcribe(
+        self,
+        audio_chunks: AsyncIterator[Union[str, bytes, np.ndarray]],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        target_sr: int = 16000
+    ) -> AsyncIterator[dict]:
+        """
+        Transcribe a live stream of audio chunks, yielding segments as they complete.
+        
+        A producer task preprocesses incoming chunks while the consumer
+        transcribes the previous one, so decode/resample work overlaps
+        with inference instead of waiting for the whole recording.
+        
+        Args:
+            audio_chunks: Async iterator of audio chunks (paths, bytes, or numpy arrays)
+            language: Language code (e.g., "en", "es") or None for auto-detection
+            task: "transcribe" or "translate"
+            target_sr: Sample rate chunks are preprocessed to
+            
+        Yields:
+            Segments with text and timestamps relative to the start of the stream
+        """
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(
+            self._preprocess_chunks(audio_chunks, queue, target_sr)
         )
+        offset = 0.0
         
-        return result
+        try:
+            while True:
+                audio = await queue.get()
+                if audio is None:
+                    break
+                if isinstance(audio, Exception):
+                    raise audio
+                
+                result = await loop.run_in_executor(
+                    None, self._transcribe_preprocessed, audio, language, task
+                )
+                
+                for segment in result["segments"]:
+                    yield {
+                        "text": segment["text"].strip(),
+                        "start": segment["start"] + offset,
+                        "end": segment["end"] + offset
+                    }
+                
+                offset += audio.shape[0] / target_sr
+        finally:
+            producer.cancel()
     
-    def extract_segments_with_timestamps(self, transcription_result: dict) -> list:
+    async def _preprocess_chunks(
+        self,
+        audio_chunks: AsyncIterator[Union[str, bytes, np.ndarray]],
+        queue: asyncio.Queue,
+        target_sr: int
+    ) -> None:
+        """Producer for stream_transcribe: preprocess chunks onto the queue."""
+        loop = asyncio.get_event_loop()
+        
+        try:
+            async for chunk in audio_chunks:
+                audio = await loop.run_in_executor(
+                    None, self.preprocess_audio, chunk, target_sr
+                )
+                await queue.put(audio)
+        except Exception as e:
+            await queue.put(e)
+            return
+        
+        await queue.put(None)
+    
+    def transcribe_batch(
+        self,
+        audios: List[Union[str, bytes, np.ndarray]],
+        language: Optional[str] = None,
+        task: str = "transcribe",
+        batch_size: int = 8
+    ) -> List[dict]:
         """
-        Extract text segments with timestamps from transcription result.
+        Transcribe several audio inputs, batching speech windows within each.
+        
+        Inputs are transcribed one after another; batching happens across
+        the VAD speech windows of a single input, not across the list.
+        With vad_filter off each input is decoded with the sequential model.
         
         Args:
-            transcription_result: Result from transcribe() method
+            audios: Audio inputs (file paths, bytes, or numpy arrays)
+            language: Language code (e.g., "en", "es") or None for auto-detection
+            task: "transcribe" or "translate"
+            batch_size: Number of speech windows of one input encoded per forward pass
             
         Returns:
-            List of segments with text and timestamps
+            List of transcription result dictionaries, one per input
+        """
+        # The batched pipeline takes its 30-second windows from VAD and
+        # rejects audio longer than 30 s without it, so decode sequentially
+        if not self.vad_filter:
+            return [
+                self._transcribe_preprocessed(self._preprocess(audio_data), language, task)
+                for audio_data in audios
+            ]
+        
+        if self._batched_pipeline is None:
+            from faster_whisper import BatchedInferencePipeline
+            
+            self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+        
+        results = []
+        
+        for audio_data in audios:
+            audio = self._preprocess(audio_data)
+            
+            with self._model_lock:
+                segments, info = self._batched_pipeline.transcribe(
+                    audio,
+                    language=language,
+                    task=task,
+                    batch_size=batch_size,
+                    vad_filter=self.vad_filter,
+                    vad_parameters=self.vad_parameters
+                )
+                results.append(self._build_result(segments, info))
+        
+        return results
+    
+    @staticmethod
+    def _build_result(segments, info) -> dict:
+        """
+        Materialize faster-whisper segments into the transcription dict schema.
+        
+        Args:
+            segments: Segment iterable returned by WhisperModel.transcribe
+            info: TranscriptionInfo returned by WhisperModel.transcribe
+            
+        Returns:
+            Dictionary with "text", "segments" and "language" keys
+        """
+        segment_dicts = [
+            {
+                "id": segment.id,
+                "start": segment.start,
+                "end": segment.end,
+                "text": segment.text,
+                "avg_logprob": segment.avg_logprob,
+                "no_speech_prob": segment.no_speech_prob
+            }
+            for segment in segments
+        ]
+        
+        return {
+            "text": "".join(segment["text"] for segment in segment_dicts).strip(),
+            "segments": segment_dicts,
+            "language": info.language
+        }
+    
+    def iter_segments(self, transcription_result: dict) -> Iterator[dict]:
+        """
+        Lazily yield text segments with timestamps from transcription result.
+        
+        Args:
+            transcription_result: Result from transcribe() method
+            
+        Yields:
+            Segments with text, timestamps and confidence
         """
-        segments = []
+        raw_segments = transcription_result.get("segments", [])
+        confidences = self._segment_confidences(raw_segments)
         
-        for segment in transcription_result.get("segments", []):
-            segments.append({
+        for segment, confidence in zip(raw_segments, confidences.tolist()):
+            yield {
                 "text": segment["text"].strip(),
                 "start": segment["start"],
                 "end": segment["end"],
-                "confidence": segment.get("no_speech_prob", 0.0)
-            })
+                "confidence": confidence
+            }
+    
+    def extract_segments_with_timestamps(self, transcription_result: dict) -> list:
+        """
+        Extract text segments with timestamps from transcription result.
         
-        return segments
+        Args:
+            transcription_result: Result from transcribe() method
+            
+        Returns:
+            List of segments with text and timestamps
+        """
+        return list(self.iter_segments(transcription_result))
     
     def get_confidence_score(self, transcription_result: dict) -> float:
         """
@@ -223,25 +640,50 @@ class ASRProcessor:
         if not segments:
             return 0.0
         
-        # Calculate average confidence (1 - no_speech_prob)
-        total_confidence = sum(
-            1.0 - segment.get("no_speech_prob", 0.0) 
-            for segment in segments
-        )
+        # Calculate average confidence (token probability from avg_logprob)
+        return float(self._segment_confidences(segments).mean())
+    
+    @staticmethod
+    def _segment_confidences(segments: list) -> np.ndarray:
+        """
+        Compute per-segment confidence as exp(avg_logprob) in one vector pass.
         
-        return total_confidence / len(segments)
+        Args:
+            segments: Segment dictionaries from a transcription result
+            
+        Returns:
+            Array of confidence values (0.0 to 1.0)
+        """
+        logprobs = np.fromiter(
+            (segment.get("avg_logprob", 0.0) for segment in segments),
+            dtype=np.float32,
+            count=len(segments)
+        )
+        return np.exp(logprobs)
 
 
 # Factory function for easy instantiation
-def create_asr_processor(model_size: str = "base", device: str = "cpu") -> ASRProcessor:
+def create_asr_processor(
+    model_size: str = "base",
+    device: str = "cpu",
+    vad_filter: bool = True,
+    compute_type: Optional[str] = None
+) -> ASRProcessor:
     """
     Factory function to create an ASR processor.
     
     Args:
         model_size: Whisper model size
         device: Device for inference
+        vad_filter: Skip non-speech audio before decoding
+        compute_type: Weight precision, or None for int8 (CPU) / float16 (CUDA)
         
     Returns:
         Configured ASRProcessor instance
     """
-    return ASRProcessor(model_size=model_size, device=device)
+    return ASRProcessor(
+        model_size=model_size,
+        device=device,
+        vad_filter=vad_filter,
+        compute_type=compute_type
+    )
@@ -3,7 +3,6 @@ Audio recording utilities for real-time speech capture.
 """
 
 import asyncio
-import threading
 import time
 from typing import Callable, Optional
 
@@ -12,6 +11,15 @@ import pyaudio
 import wave
 
 
+# NumPy sample types matching the PyAudio sample formats
+_FORMAT_DTYPES = {
+    pyaudio.paInt8: np.int8,
+    pyaudio.paInt16: np.int16,
+    pyaudio.paInt32: np.int32,
+    pyaudio.paFloat32: np.float32
+}
+
+
 class AudioRecorder:
     """Real-time audio recorder for microphone input."""
     
@@ -20,7 +28,8 @@ class AudioRecorder:
         sample_rate: int = 16000,
         channels: int = 1,
         chunk_size: int = 1024,
-        format: int = pyaudio.paInt16
+        format: int = pyaudio.paInt16,
+        block_seconds: int = 600
     ):
         """
         Initialize audio recorder.
@@ -30,24 +39,36 @@ class AudioRecorder:
             channels: Number of audio channels
             chunk_size: Audio chunk size for processing
             format: Audio format
+            block_seconds: Audio held per pre-allocated buffer block; longer
+                recordings continue into further blocks, nothing is dropped
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
         self.format = format
+        self.block_seconds = block_seconds
         
         self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.frames = []
+        
+        # Pre-allocated block so the capture thread only allocates once per
+        # block_seconds of audio; filled blocks are kept in _full_blocks
+        self._block = np.empty(
+            sample_rate * channels * block_seconds,
+            dtype=_FORMAT_DTYPES[format]
+        )
+        self._full_blocks = []
+        self._write_idx = 0
+        
         self.is_recording = False
-        self.recording_thread = None
     
     def start_recording(self) -> None:
         """Start recording audio from microphone."""
         if self.is_recording:
             return
         
-        self.frames = []
+        self._full_blocks = []
+        self._write_idx = 0
         self.is_recording = True
         
         self.stream = self.audio.open(
@@ -55,11 +76,14 @@ class AudioRecorder:
             channels=self.channels,
             rate=self.sample_rate,
             input=True,
-            frames_per_buffer=self.chunk_size
+            # Two chunks per PortAudio buffer halves the callback rate
+            frames_per_buffer=self.chunk_size * 2,
+            stream_callback=self._pa_callback,
+            start=False
         )
         
-        self.recording_thread = threading.Thread(target=self._record_audio)
-        self.recording_thread.start()
+        # PortAudio delivers buffers to _pa_callback on its own thread
+        self.stream.start_stream()
         
         print("Recording started...")
     
@@ -75,28 +99,42 @@ class AudioRecorder:
         
         self.is_recording = False
         
-        if self.recording_thread:
-            self.recording_thread.join()
-        
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
         
         print("Recording stopped.")
         
-        # Convert frames to bytes
-        audio_data = b"".join(self.frames)
-        return audio_data
+        # Convert buffered blocks to bytes, oldest sample first
+        return np.concatenate(
+            (*self._full_blocks, self._block[:self._write_idx])
+        ).tobytes()
     
-    def _record_audio(self) -> None:
-        """Internal method to record audio in separate thread."""
-        while self.is_recording:
-            try:
-                data = self.stream.read(self.chunk_size, exception_on_overflow=False)
-                self.frames.append(data)
-            except Exception as e:
-                print(f"Error during recording: {e}")
-                break
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio stream callback that stores each captured buffer."""
+        self._buffer_write(in_data)
+        return (None, pyaudio.paContinue)
+    
+    def _buffer_write(self, data: bytes) -> None:
+        """
+        Copy a captured chunk into the current block, starting a new block when full.
+        
+        Args:
+            data: Raw audio bytes from the input stream
+        """
+        samples = np.frombuffer(data, dtype=self._block.dtype)
+        size = self._block.shape[0]
+        
+        while samples.shape[0]:
+            n = min(samples.shape[0], size - self._write_idx)
+            self._block[self._write_idx:self._write_idx + n] = samples[:n]
+            self._write_idx += n
+            samples = samples[n:]
+            
+            if self._write_idx == size:
+                self._full_blocks.append(self._block)
+                self._block = np.empty(size, dtype=self._block.dtype)
+                self._write_idx = 0
     
     def save_recording(self, filename: str, audio_data: bytes) -> None:
         """
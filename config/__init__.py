@@ -13,6 +13,7 @@ class Config:
     ASR_MODEL_SIZE = os.getenv("ASR_MODEL_SIZE", "base")  # tiny, base, small, medium, large
     ASR_DEVICE = os.getenv("ASR_DEVICE", "cpu")  # cpu or cuda
     ASR_LANGUAGE = os.getenv("ASR_LANGUAGE", "en")
+    ASR_MAX_CONCURRENT_JOBS = int(os.getenv("WHISPER_MAX_CONCURRENT_JOBS", "2"))  # worker processes
     
     # Audio Configuration
     AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
@@ -42,7 +43,8 @@ class Config:
             "asr": {
                 "model_size": cls.ASR_MODEL_SIZE,
                 "device": cls.ASR_DEVICE,
-                "language": cls.ASR_LANGUAGE
+                "language": cls.ASR_LANGUAGE,
+                "max_concurrent_jobs": cls.ASR_MAX_CONCURRENT_JOBS
             },
             "nlp": {
                 "ner_model": cls.NER_MODEL,
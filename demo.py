@@ -2,10 +2,10 @@
 Enhanced demo version of MediSynth Agent with modern UI animations.
 """
 
+import re
 import streamlit as st
 import tempfile
 import os
-import time
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
@@ -17,32 +17,28 @@ class MockASRProcessor:
         self.device = device
     
     def transcribe(self, audio_path, language="en"):
-        # Simulate processing with progress
-        progress_bar = st.progress(0)
-        for i in range(100):
-            time.sleep(0.01)  # Simulate processing time
-            progress_bar.progress(i + 1)
-        
         # Mock transcription result with realistic medical conversation
         return {
-            "text": "Good morning doctor. I've been having chest pain since last night. It started around 10 PM and it's been bothering me. The pain is sharp and comes and goes. Sometimes it's worse when I take a deep breath. I also felt a bit nauseous this morning and had trouble sleeping."
+            "text": "Good morning doctor. I've been having chest pain since last night. It started around 10 PM and it's been bothering me. The pain is sharp and comes and goes. Sometimes it's worse when I take a deep breath. I also felt a bit nauseous this morning and had trouble sleeping.",
+            "segments": [
+                {"text": "Good morning doctor.", "start": 0.0, "end": 1.4},
+                {"text": "I've been having chest pain since last night.", "start": 1.4, "end": 4.2},
+                {"text": "It started around 10 PM and it's been bothering me.", "start": 4.2, "end": 7.5},
+                {"text": "The pain is sharp and comes and goes.", "start": 7.5, "end": 10.1},
+                {"text": "Sometimes it's worse when I take a deep breath.", "start": 10.1, "end": 13.0},
+                {"text": "I also felt a bit nauseous this morning and had trouble sleeping.", "start": 13.0, "end": 17.2}
+            ]
         }
     
+    def iter_segments(self, result):
+        for segment in result.get("segments", []):
+            yield segment
+    
     def get_confidence_score(self, result):
         return 0.87
 
 class MockClinicalProcessor:
     def process_conversation(self, text):
-        # Simulate processing with progress
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        for i, stage in enumerate(["Analyzing text...", "Extracting entities...", "Categorizing findings..."]):
-            status_text.text(stage)
-            for j in range(33):
-                time.sleep(0.005)
-                progress_bar.progress(i * 33 + j + 1)
-        
         # Enhanced mock entity extraction
         entities = [
             {"text": "chest pain", "label": "SYMPTOM", "confidence": 0.92, "start": 45, "end": 55},
@@ -119,6 +115,23 @@ class MockSOAPGenerator:
         
         return "\n".join(formatted)
 
+HIGHLIGHT_TEMPLATE = '<mark style="background-color: #ffcccb; padding: 2px 4px; border-radius: 3px;">{}</mark>'
+
+def highlight_entities(text, entities):
+    """Wrap every entity mention in <mark> tags in a single regex pass."""
+    mentions = sorted({entity["text"] for entity in entities if entity["text"]}, key=len, reverse=True)
+    if not mentions:
+        return text
+    
+    # Longest alternatives first so overlapping mentions match the widest span
+    pattern = re.compile("|".join(re.escape(mention) for mention in mentions))
+    return pattern.sub(lambda match: HIGHLIGHT_TEMPLATE.format(match.group(0)), text)
+
+@st.cache_resource
+def get_processors():
+    """Create the mock processors once and reuse them across reruns."""
+    return MockASRProcessor(), MockClinicalProcessor(), MockSOAPGenerator()
+
 def main():
     st.set_page_config(
         page_title="MediSynth Agent - Demo",
@@ -143,9 +156,7 @@ def main():
         st.session_state.soap_note = {}
     
     # Initialize mock processors
-    asr_processor = MockASRProcessor()
-    clinical_processor = MockClinicalProcessor()
-    soap_generator = MockSOAPGenerator()
+    asr_processor, clinical_processor, soap_generator = get_processors()
     
     # Sidebar
     with st.sidebar:
@@ -183,6 +194,11 @@ def main():
         
         st.success(f"✅ Transcription completed! Confidence: {confidence:.2%}")
         
+        # Render segments progressively as they are produced
+        with st.container():
+            for segment in asr_processor.iter_segments(result):
+                st.write(f"`{segment['start']:05.1f}s` {segment['text']}")
+        
         # Process NLP
         with st.spinner("🧠 Analyzing clinical content..."):
             processed_data = clinical_processor.process_conversation(st.session_state.transcription)
@@ -227,15 +243,10 @@ def main():
             
             with col2:
                 st.subheader("🎯 Highlighted Text")
-                highlighted_text = st.session_state.transcription
-                
-                # Simple highlighting
-                for entity in st.session_state.entities:
-                    text = entity["text"]
-                    highlighted_text = highlighted_text.replace(
-                        text, 
-                        f'<mark style="background-color: #ffcccb; padding: 2px 4px; border-radius: 3px;">{text}</mark>'
-                    )
+                highlighted_text = highlight_entities(
+                    st.session_state.transcription,
+                    st.session_state.entities
+                )
                 
                 st.markdown(highlighted_text, unsafe_allow_html=True)
         
@@ -2,12 +2,14 @@
 Advanced Modern UI for MediSynth Agent - Premium Healthcare Application
 """
 
-import streamlit as st
-import tempfile
-import os
-import time
 import json
+import streamlit as st
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+from statistics import fmean
+
+from static_assets import load_css
 
 # Configure page with advanced settings
 st.set_page_config(
@@ -17,542 +19,99 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Advanced Modern CSS Framework
-st.markdown("""
-<style>
-/* Import Premium Fonts */
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap');
-
-/* CSS Variables for Design System */
-:root {
-    --primary-50: #eff6ff;
-    --primary-100: #dbeafe;
-    --primary-500: #3b82f6;
-    --primary-600: #2563eb;
-    --primary-700: #1d4ed8;
-    --primary-900: #1e3a8a;
-    
-    --gray-50: #f9fafb;
-    --gray-100: #f3f4f6;
-    --gray-200: #e5e7eb;
-    --gray-300: #d1d5db;
-    --gray-400: #9ca3af;
-    --gray-500: #6b7280;
-    --gray-600: #4b5563;
-    --gray-700: #374151;
-    --gray-800: #1f2937;
-    --gray-900: #111827;
-    
-    --success-50: #ecfdf5;
-    --success-500: #10b981;
-    --success-600: #059669;
-    
-    --warning-50: #fffbeb;
-    --warning-500: #f59e0b;
-    
-    --error-50: #fef2f2;
-    --error-500: #ef4444;
-    
-    --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.05);
-    --shadow: 0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1);
-    --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.1), 0 2px 4px -2px rgb(0 0 0 / 0.1);
-    --shadow-lg: 0 10px 15px -3px rgb(0 0 0 / 0.1), 0 4px 6px -4px rgb(0 0 0 / 0.1);
-    --shadow-xl: 0 20px 25px -5px rgb(0 0 0 / 0.1), 0 8px 10px -6px rgb(0 0 0 / 0.1);
-}
-
-/* Global Reset and Base Styles */
-* {
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
-}
-
-.main {
-    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    background: linear-gradient(135deg, var(--gray-50) 0%, #ffffff 100%);
-    color: var(--gray-900);
-    line-height: 1.6;
-}
-
-/* Advanced Header Design */
-.modern-header {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    border-radius: 16px;
-    padding: 2rem;
-    margin-bottom: 2rem;
-    box-shadow: var(--shadow-xl);
-    position: relative;
-    overflow: hidden;
-}
-
-.modern-header::before {
-    content: '';
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: url('data:image/svg+xml,<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><pattern id="grid" width="10" height="10" patternUnits="userSpaceOnUse"><path d="M 10 0 L 0 0 0 10" fill="none" stroke="rgba(255,255,255,0.1)" stroke-width="0.5"/></pattern></defs><rect width="100" height="100" fill="url(%23grid)"/></svg>');
-    opacity: 0.3;
-}
-
-.header-content {
-    position: relative;
-    z-index: 1;
-}
-
-.header-title {
-    color: white;
-    font-size: 2.5rem;
-    font-weight: 800;
-    margin-bottom: 0.5rem;
-    text-shadow: 0 2px 4px rgba(0,0,0,0.3);
-}
-
-.header-subtitle {
-    color: rgba(255,255,255,0.9);
-    font-size: 1.125rem;
-    font-weight: 400;
-    opacity: 0.95;
-}
-
-.header-badge {
-    display: inline-flex;
-    align-items: center;
-    background: rgba(255,255,255,0.2);
-    backdrop-filter: blur(10px);
-    border: 1px solid rgba(255,255,255,0.3);
-    border-radius: 50px;
-    padding: 0.5rem 1rem;
-    color: white;
-    font-size: 0.875rem;
-    font-weight: 500;
-    margin-top: 1rem;
-}
-
-/* Advanced Card System */
-.premium-card {
-    background: white;
-    border-radius: 12px;
-    border: 1px solid var(--gray-200);
-    box-shadow: var(--shadow-md);
-    transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
-    overflow: hidden;
-    position: relative;
-}
-
-.premium-card:hover {
-    transform: translateY(-2px);
-    box-shadow: var(--shadow-xl);
-    border-color: var(--primary-300);
-}
-
-.card-header {
-    padding: 1.5rem 1.5rem 1rem;
-    border-bottom: 1px solid var(--gray-100);
-    background: var(--gray-50);
-}
-
-.card-title {
-    font-size: 1.125rem;
-    font-weight: 600;
-    color: var(--gray-900);
-    margin-bottom: 0.25rem;
-}
-
-.card-subtitle {
-    font-size: 0.875rem;
-    color: var(--gray-600);
-}
-
-.card-body {
-    padding: 1.5rem;
-}
-
-/* Advanced Button System */
-.modern-btn {
-    display: inline-flex;
-    align-items: center;
-    justify-content: center;
-    gap: 0.5rem;
-    padding: 0.75rem 1.5rem;
-    border-radius: 8px;
-    font-weight: 600;
-    font-size: 0.875rem;
-    text-decoration: none;
-    transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1);
-    cursor: pointer;
-    border: none;
-    position: relative;
-    overflow: hidden;
-}
-
-.btn-primary {
-    background: linear-gradient(135deg, var(--primary-600) 0%, var(--primary-700) 100%);
-    color: white;
-    box-shadow: var(--shadow-sm);
-}
-
-.btn-primary:hover {
-    background: linear-gradient(135deg, var(--primary-700) 0%, var(--primary-800) 100%);
-    box-shadow: var(--shadow-md);
-    transform: translateY(-1px);
-}
-
-.btn-secondary {
-    background: white;
-    color: var(--gray-700);
-    border: 1px solid var(--gray-300);
-}
-
-.btn-secondary:hover {
-    background: var(--gray-50);
-    border-color: var(--gray-400);
-}
-
-/* Advanced Status System */
-.status-badge {
-    display: inline-flex;
-    align-items: center;
-    gap: 0.375rem;
-    padding: 0.25rem 0.75rem;
-    border-radius: 6px;
-    font-size: 0.75rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.025em;
-}
-
-.status-success {
-    background: var(--success-50);
-    color: var(--success-600);
-    border: 1px solid var(--success-200);
-}
-
-.status-warning {
-    background: var(--warning-50);
-    color: var(--warning-600);
-    border: 1px solid var(--warning-200);
-}
-
-.status-info {
-    background: var(--primary-50);
-    color: var(--primary-600);
-    border: 1px solid var(--primary-200);
-}
-
-/* Advanced Progress System */
-.progress-container {
-    background: white;
-    border-radius: 12px;
-    border: 1px solid var(--gray-200);
-    padding: 1.5rem;
-    margin-bottom: 1.5rem;
-}
-
-.progress-step {
-    display: flex;
-    align-items: center;
-    gap: 1rem;
-    padding: 1rem 0;
-    position: relative;
-}
-
-.progress-step:not(:last-child)::after {
-    content: '';
-    position: absolute;
-    left: 1rem;
-    top: 3rem;
-    width: 2px;
-    height: 2rem;
-    background: var(--gray-200);
-}
-
-.progress-step.completed::after {
-    background: var(--success-500);
-}
-
-.step-indicator {
-    width: 2rem;
-    height: 2rem;
-    border-radius: 50%;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-weight: 600;
-    font-size: 0.875rem;
-    transition: all 0.3s ease;
-}
-
-.step-indicator.pending {
-    background: var(--gray-100);
-    color: var(--gray-400);
-    border: 2px solid var(--gray-200);
-}
-
-.step-indicator.active {
-    background: var(--primary-500);
-    color: white;
-    border: 2px solid var(--primary-500);
-    box-shadow: 0 0 0 4px var(--primary-100);
-}
-
-.step-indicator.completed {
-    background: var(--success-500);
-    color: white;
-    border: 2px solid var(--success-500);
-}
-
-.step-content {
-    flex: 1;
-}
-
-.step-title {
-    font-weight: 600;
-    color: var(--gray-900);
-    margin-bottom: 0.25rem;
-}
-
-.step-description {
-    color: var(--gray-600);
-    font-size: 0.875rem;
-}
-
-/* Advanced Entity System */
-.entity-container {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 0.5rem;
-    margin: 1rem 0;
-}
-
-.entity-tag {
-    display: inline-flex;
-    align-items: center;
-    gap: 0.375rem;
-    padding: 0.375rem 0.75rem;
-    border-radius: 6px;
-    font-size: 0.875rem;
-    font-weight: 500;
-    font-family: 'JetBrains Mono', monospace;
-    transition: all 0.2s ease;
-    cursor: pointer;
-    position: relative;
-}
-
-.entity-tag:hover {
-    transform: translateY(-1px);
-    box-shadow: var(--shadow-md);
-}
-
-.entity-symptom {
-    background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);
-    color: #1e40af;
-    border: 1px solid #93c5fd;
-}
-
-.entity-medication {
-    background: linear-gradient(135deg, #d1fae5 0%, #bbf7d0 100%);
-    color: #059669;
-    border: 1px solid #86efac;
-}
-
-.entity-condition {
-    background: linear-gradient(135deg, #fed7d7 0%, #fbb6ce 100%);
-    color: #be185d;
-    border: 1px solid #f9a8d4;
-}
-
-.entity-vital {
-    background: linear-gradient(135deg, #e0e7ff 0%, #c7d2fe 100%);
-    color: #4338ca;
-    border: 1px solid #a5b4fc;
-}
-
-/* Advanced SOAP Note System */
-.soap-container {
-    display: grid;
-    gap: 1.5rem;
-    margin: 1.5rem 0;
-}
-
-.soap-section {
-    background: white;
-    border-radius: 12px;
-    border: 1px solid var(--gray-200);
-    overflow: hidden;
-    transition: all 0.3s ease;
-}
-
-.soap-section:hover {
-    box-shadow: var(--shadow-lg);
-}
-
-.soap-header {
-    background: linear-gradient(135deg, var(--gray-50) 0%, var(--gray-100) 100%);
-    padding: 1rem 1.5rem;
-    border-bottom: 1px solid var(--gray-200);
-}
-
-.soap-title {
-    font-weight: 700;
-    font-size: 1rem;
-    color: var(--gray-900);
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-}
-
-.soap-body {
-    padding: 1.5rem;
-}
-
-/* Advanced Metrics System */
-.metrics-grid {
-    display: grid;
-    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-    gap: 1rem;
-    margin: 1.5rem 0;
-}
-
-.metric-card {
-    background: white;
-    border-radius: 12px;
-    border: 1px solid var(--gray-200);
-    padding: 1.5rem;
-    text-align: center;
-    transition: all 0.3s ease;
-    position: relative;
-    overflow: hidden;
-}
-
-.metric-card::before {
-    content: '';
-    position: absolute;
-    top: 0;
-    left: 0;
-    right: 0;
-    height: 4px;
-    background: linear-gradient(90deg, var(--primary-500) 0%, var(--primary-600) 100%);
-}
-
-.metric-card:hover {
-    transform: translateY(-2px);
-    box-shadow: var(--shadow-lg);
-}
-
-.metric-value {
-    font-size: 2rem;
-    font-weight: 800;
-    color: var(--primary-600);
-    margin-bottom: 0.5rem;
-}
-
-.metric-label {
-    font-size: 0.875rem;
-    font-weight: 500;
-    color: var(--gray-600);
-    text-transform: uppercase;
-    letter-spacing: 0.05em;
-}
-
-/* Advanced Form Elements */
-.modern-input {
-    width: 100%;
-    padding: 0.75rem 1rem;
-    border: 1px solid var(--gray-300);
-    border-radius: 8px;
-    font-size: 0.875rem;
-    transition: all 0.2s ease;
-    background: white;
-}
+# Advanced Modern CSS Framework (static/demo_advanced.css), minified before shipping
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+
+FONTS = ("Inter:wght@400;500;600;700;800", "JetBrains+Mono:wght@500")
+
+# Emitted on every rerun (Streamlit drops elements a rerun does not write),
+# but the payload itself is built only once
+st.markdown(load_css("demo_advanced.css", FONTS), unsafe_allow_html=True)
+
+@st.cache_resource
+def _load_template(name):
+    """Read a template under templates/ once per server process."""
+    return (TEMPLATE_DIR / name).read_text(encoding="utf-8").rstrip("\n")
+
+# Processing stage card shared by the mock pipeline components; like the
+# other template constants it is rebound on every rerun, but from the
+# process-wide cache rather than from disk
+_STAGE_TPL = _load_template("html/stage_card.html")
+
+
+def _render_stage_card(name, desc, progress, status_label, status_class, gradient_from, gradient_to, delay=0):
+    """Return the HTML for one processing stage card."""
+    return _STAGE_TPL.format(
+        name=name,
+        desc=desc,
+        progress=progress,
+        status_label=status_label,
+        status_class=status_class,
+        gradient_from=gradient_from,
+        gradient_to=gradient_to,
+        delay=f"{delay:.1f}"
+    )
+
+
+def _render_stages(stages, status_class, color):
+    """Emit every stage card in one write; the bars fill in sequence client-side."""
+    st.markdown("".join(
+        _render_stage_card(
+            name,
+            desc,
+            100,
+            "Complete",
+            status_class,
+            f"var(--{color}-500)",
+            f"var(--{color}-600)",
+            delay=i * 0.4
+        )
+        for i, (name, desc) in enumerate(stages)
+    ), unsafe_allow_html=True)
 
-.modern-input:focus {
-    outline: none;
-    border-color: var(--primary-500);
-    box-shadow: 0 0 0 3px var(--primary-100);
-}
+_CARD_HEADER_TPL = _load_template("html/card_header.html")
+_METRIC_TPL = _load_template("html/metric_card.html")
+_ENTITY_TPL = _load_template("html/entity_tag.html")
 
-/* Advanced Loading States */
-.loading-overlay {
-    position: fixed;
-    top: 0;
-    left: 0;
-    right: 0;
-    bottom: 0;
-    background: rgba(255, 255, 255, 0.9);
-    backdrop-filter: blur(4px);
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    z-index: 1000;
-}
 
-.loading-spinner {
-    width: 40px;
-    height: 40px;
-    border: 4px solid var(--gray-200);
-    border-top-color: var(--primary-500);
-    border-radius: 50%;
-    animation: spin 1s linear infinite;
-}
+def _render_card_header(title, subtitle):
+    """Emit a step card header as one self-contained block."""
+    st.markdown(_CARD_HEADER_TPL.format(title=title, subtitle=subtitle), unsafe_allow_html=True)
 
-@keyframes spin {
-    to {
-        transform: rotate(360deg);
-    }
-}
 
-/* Advanced Responsive Design */
-@media (max-width: 768px) {
-    .header-title {
-        font-size: 2rem;
-    }
-    
-    .metrics-grid {
-        grid-template-columns: 1fr;
-    }
-    
-    .soap-container {
-        gap: 1rem;
-    }
-}
+def _render_metrics(metrics):
+    """Emit (value, label) metric cards as one grid; CSS handles the columns."""
+    cards = "".join(_METRIC_TPL.format(value=value, label=label) for value, label in metrics)
+    st.markdown(f'<div class="metrics-grid">{cards}</div>', unsafe_allow_html=True)
 
-/* Streamlit Overrides */
-.stButton > button {
-    background: linear-gradient(135deg, var(--primary-600) 0%, var(--primary-700) 100%) !important;
-    color: white !important;
-    border: none !important;
-    border-radius: 8px !important;
-    padding: 0.75rem 1.5rem !important;
-    font-weight: 600 !important;
-    font-size: 0.875rem !important;
-    transition: all 0.2s ease !important;
-    box-shadow: var(--shadow-sm) !important;
-}
-
-.stButton > button:hover {
-    background: linear-gradient(135deg, var(--primary-700) 0%, var(--primary-800) 100%) !important;
-    transform: translateY(-1px) !important;
-    box-shadow: var(--shadow-md) !important;
-}
-
-.stTextArea > div > div > textarea {
-    border: 1px solid var(--gray-300) !important;
-    border-radius: 8px !important;
-    font-family: 'Inter', sans-serif !important;
-}
+# Processing stages shown by each mock pipeline component: (name, description)
+_ASR_STAGES = (
+    ("Audio Preprocessing", "Normalizing audio signal"),
+    ("Model Loading", "Loading Whisper large-v3 model"),
+    ("Speech Detection", "Identifying speech segments"),
+    ("Transcription", "Converting speech to text"),
+)
+_NLP_STAGES = (
+    ("Text Tokenization", "Breaking down clinical text"),
+    ("Model Inference", "Running BioBERT entity extraction"),
+    ("Entity Classification", "Categorizing medical entities"),
+    ("Confidence Scoring", "Calculating prediction confidence"),
+    ("Post-processing", "Filtering and ranking results"),
+)
+_SOAP_STAGES = tuple(
+    (f"Generating {section} Section", "Creating structured clinical documentation")
+    for section in ("Subjective", "Objective", "Assessment", "Plan")
+)
 
-.stTextArea > div > div > textarea:focus {
-    border-color: var(--primary-500) !important;
-    box-shadow: 0 0 0 3px var(--primary-100) !important;
-}
+SOAP_SECTIONS = ("subjective", "objective", "assessment", "plan")
 
-/* Hide Streamlit branding */
-#MainMenu {visibility: hidden;}
-footer {visibility: hidden;}
-header {visibility: hidden;}
-</style>
-""", unsafe_allow_html=True)
+# (section, title, description) for the SOAP editor
+SOAP_SECTION_HEADERS = (
+    ("subjective", "SUBJECTIVE", "Patient's reported symptoms and history"),
+    ("objective", "OBJECTIVE", "Observable findings and measurements"),
+    ("assessment", "ASSESSMENT", "Clinical assessment and diagnosis"),
+    ("plan", "PLAN", "Treatment plan and follow-up"),
+)
 
 # Advanced Mock Classes
 class AdvancedASR:
@@ -561,35 +120,16 @@ class AdvancedASR:
         self.confidence_threshold = 0.85
     
     def transcribe(self, audio_file):
+        """Yield {"type": "segment", ...} entries, then one {"type": "summary", ...}."""
         # Advanced progress with stages
-        progress_container = st.empty()
-        
-        stages = [
-            {"name": "Audio Preprocessing", "desc": "Normalizing audio signal", "progress": 25},
-            {"name": "Model Loading", "desc": "Loading Whisper large-v3 model", "progress": 50},
-            {"name": "Speech Detection", "desc": "Identifying speech segments", "progress": 75},
-            {"name": "Transcription", "desc": "Converting speech to text", "progress": 100}
-        ]
-        
-        for stage in stages:
-            progress_container.markdown(f"""
-            <div class="premium-card">
-                <div class="card-body">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                        <span style="font-weight: 600;">{stage['name']}</span>
-                        <span class="status-badge status-info">Processing</span>
-                    </div>
-                    <div style="color: var(--gray-600); font-size: 0.875rem; margin-bottom: 1rem;">{stage['desc']}</div>
-                    <div style="background: var(--gray-200); height: 8px; border-radius: 4px; overflow: hidden;">
-                        <div style="background: linear-gradient(90deg, var(--primary-500), var(--primary-600)); height: 100%; width: {stage['progress']}%; transition: width 0.5s ease;"></div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            time.sleep(0.8)
-        
-        progress_container.empty()
-        
+        _render_stages(_ASR_STAGES, "status-info", "primary")
+        result = self._compute(audio_file)
+        for segment in result["segments"]:
+            yield {"type": "segment", **segment}
+        yield {"type": "summary", "text": result["text"], "confidence": result["confidence"]}
+    
+    @st.cache_data(show_spinner=False)
+    def _compute(_self, audio_file):
         return {
             "text": "Good morning, Doctor. I've been experiencing persistent chest pain for approximately 24 hours. The pain is described as sharp, substernal, and pleuritic in nature, worsening with deep inspiration and movement. I've also noted associated symptoms including mild dyspnea, intermittent nausea, and diaphoresis. My past medical history is significant for hypertension, currently managed with lisinopril 10 milligrams daily. I have no known drug allergies. The pain initially began last evening around 10 PM while I was at rest watching television.",
             "confidence": 0.92,
@@ -605,35 +145,11 @@ class AdvancedNLP:
     
     def extract_entities(self, text):
         # Advanced processing visualization
-        progress_container = st.empty()
-        
-        stages = [
-            {"name": "Text Tokenization", "desc": "Breaking down clinical text", "progress": 20},
-            {"name": "Model Inference", "desc": "Running BioBERT entity extraction", "progress": 40},
-            {"name": "Entity Classification", "desc": "Categorizing medical entities", "progress": 60},
-            {"name": "Confidence Scoring", "desc": "Calculating prediction confidence", "progress": 80},
-            {"name": "Post-processing", "desc": "Filtering and ranking results", "progress": 100}
-        ]
-        
-        for stage in stages:
-            progress_container.markdown(f"""
-            <div class="premium-card">
-                <div class="card-body">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                        <span style="font-weight: 600;">{stage['name']}</span>
-                        <span class="status-badge status-warning">Analyzing</span>
-                    </div>
-                    <div style="color: var(--gray-600); font-size: 0.875rem; margin-bottom: 1rem;">{stage['desc']}</div>
-                    <div style="background: var(--gray-200); height: 8px; border-radius: 4px; overflow: hidden;">
-                        <div style="background: linear-gradient(90deg, var(--warning-500), var(--warning-600)); height: 100%; width: {stage['progress']}%; transition: width 0.5s ease;"></div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            time.sleep(0.6)
-        
-        progress_container.empty()
-        
+        _render_stages(_NLP_STAGES, "status-warning", "warning")
+        return self._compute(text)
+    
+    @st.cache_data(show_spinner=False)
+    def _compute(_self, text):
         return [
             {"text": "chest pain", "label": "SYMPTOM", "confidence": 0.96, "start": 45, "end": 55, "severity": "moderate"},
             {"text": "sharp", "label": "SYMPTOM", "confidence": 0.89, "start": 70, "end": 75, "severity": "high"},
@@ -651,126 +167,29 @@ class AdvancedSOAP:
         self.generation_model = "GPT-4 Clinical"
     
     def generate_note(self, transcription, entities):
-        # Advanced generation with real-time updates
-        progress_container = st.empty()
-        
-        sections = ["Subjective", "Objective", "Assessment", "Plan"]
-        
-        for i, section in enumerate(sections):
-            progress = (i + 1) * 25
-            progress_container.markdown(f"""
-            <div class="premium-card">
-                <div class="card-body">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
-                        <span style="font-weight: 600;">Generating {section} Section</span>
-                        <span class="status-badge status-success">AI Writing</span>
-                    </div>
-                    <div style="color: var(--gray-600); font-size: 0.875rem; margin-bottom: 1rem;">Creating structured clinical documentation</div>
-                    <div style="background: var(--gray-200); height: 8px; border-radius: 4px; overflow: hidden;">
-                        <div style="background: linear-gradient(90deg, var(--success-500), var(--success-600)); height: 100%; width: {progress}%; transition: width 0.5s ease;"></div>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            time.sleep(1.0)
-        
-        progress_container.empty()
-        
-        return {
-            "subjective": """Chief Complaint: Chest pain for 24 hours
-
-History of Present Illness:
-The patient is a [age] year old [gender] presenting with a 24-hour history of acute onset chest pain. The pain is characterized as sharp, substernal, and pleuritic in nature. The patient reports the pain is exacerbated by deep inspiration and movement. The onset was sudden, beginning around 22:00 hours yesterday evening while the patient was at rest. 
-
-Associated symptoms include:
-• Mild dyspnea
-• Intermittent nausea  
-• Diaphoresis
-
-The patient denies any recent trauma, recent travel, or similar episodes in the past.
-
-Past Medical History: 
-• Hypertension (well-controlled)
-
-Current Medications:
-• Lisinopril 10mg daily
-
-Allergies: No known drug allergies (NKDA)
-
-Social History: [To be obtained]
-Family History: [To be obtained]""",
-
-            "objective": """Vital Signs: [To be obtained during examination]
-• Temperature: ___°F
-• Blood Pressure: ___/__ mmHg  
-• Heart Rate: ___ bpm
-• Respiratory Rate: ___ breaths/min
-• Oxygen Saturation: ___% on room air
-
-Physical Examination:
-General: Patient appears alert, oriented, and in no acute distress at rest
-HEENT: [To be examined]
-Cardiovascular: [To be examined] 
-Pulmonary: [To be examined]
-Abdomen: [To be examined]
-Extremities: [To be examined]
-Neurological: [To be examined]
-
-Laboratory/Diagnostic Studies: [Pending]""",
-
-            "assessment": """Primary Diagnosis:
-1. Acute chest pain, etiology to be determined
-   - Differential diagnosis includes:
-     a) Pleuritic chest pain - most likely given symptom characteristics
-     b) Costochondritis - consider given sharp, positional nature
-     c) Cardiac etiology - low probability but must rule out given risk factors
-     d) Pulmonary embolism - consider given pleuritic nature and dyspnea
-     e) Pneumothorax - less likely but possible
-
-Secondary Diagnoses:
-2. Hypertension - stable, well-controlled on current regimen
-3. Associated symptoms (nausea, diaphoresis) - likely secondary to pain
-
-Risk Stratification:
-• Low-moderate risk for acute coronary syndrome based on presentation
-• Requires further evaluation to rule out serious etiologies""",
-
-            "plan": """Diagnostic Workup:
-1. Immediate Studies:
-   • 12-lead ECG - rule out cardiac abnormalities
-   • Chest X-ray (PA and lateral) - evaluate for pneumothorax, pneumonia
-   • Basic metabolic panel (BMP)
-   • Complete blood count (CBC)
-   • Troponin I levels (serial if indicated)
-   • D-dimer if PE suspected
-   • Arterial blood gas if respiratory distress
-
-2. Additional Studies (if indicated):
-   • CT chest with contrast (if PE suspected)
-   • Echocardiogram (if cardiac etiology suspected)
-
-Therapeutic Interventions:
-1. Pain Management:
-   • NSAIDs as appropriate (consider contraindications)
-   • Position of comfort
-   
-2. Monitoring:
-   • Continuous cardiac monitoring
-   • Serial vital signs
-   • Oxygen saturation monitoring
-
-3. Medications:
-   • Continue current lisinopril regimen
-   • Hold additional antihypertensives pending BP assessment
-
-Follow-up:
-• Cardiology consultation if cardiac etiology identified
-• Primary care follow-up within 48-72 hours
-• Return precautions for worsening symptoms
-• Patient education on when to seek immediate care
-
-Disposition: [Pending diagnostic results and clinical assessment]"""
+        # Advanced generation progress
+        _render_stages(_SOAP_STAGES, "status-success", "success")
+        return self._compute(transcription, entities)
+    
+    @st.cache_data(show_spinner=False)
+    def _compute(_self, transcription, entities):
+        return {section: _load_template(f"soap/{section}.md") for section in SOAP_SECTIONS}
+
+@st.cache_data(show_spinner=False)
+def _build_export(transcription, entities, soap_note, started_at):
+    """Serialize the clinical export once per payload."""
+    return json.dumps({
+        "session_id": "advanced_demo_" + started_at.strftime("%Y%m%d_%H%M%S"),
+        "transcription": transcription,
+        "entities": entities,
+        "soap_note": soap_note,
+        "metadata": {
+            "platform": "MediSynth Advanced",
+            "version": "2.0",
+            "timestamp": started_at.isoformat(),
+            "confidence_threshold": 0.85
         }
+    }, indent=2)
 
 # Initialize advanced session state
 if 'advanced_step' not in st.session_state:
@@ -781,11 +200,33 @@ if 'extracted_entities' not in st.session_state:
     st.session_state.extracted_entities = []
 if 'soap_documentation' not in st.session_state:
     st.session_state.soap_documentation = {}
+if 'session_started_at' not in st.session_state:
+    st.session_state.session_started_at = datetime.now()
+
+def reset_demo():
+    """Return the workflow to step 1; used as the reset button callback."""
+    st.session_state.advanced_step = 1
+    st.session_state.transcription_result = None
+    st.session_state.extracted_entities = []
+    st.session_state.soap_documentation = {}
+    st.session_state.session_started_at = datetime.now()
+
+# Initialize advanced components once per server process
+@st.cache_resource
+def get_asr():
+    return AdvancedASR()
+
+@st.cache_resource
+def get_nlp():
+    return AdvancedNLP()
 
-# Initialize advanced components
-asr = AdvancedASR()
-nlp = AdvancedNLP()
-soap = AdvancedSOAP()
+@st.cache_resource
+def get_soap():
+    return AdvancedSOAP()
+
+asr = get_asr()
+nlp = get_nlp()
+soap = get_soap()
 
 # Advanced Header
 st.markdown("""
@@ -801,33 +242,14 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Advanced System Dashboard
-st.markdown("""
-<div class="metrics-grid">
-    <div class="metric-card">
-        <div class="metric-value">99.2%</div>
-        <div class="metric-label">Accuracy</div>
-    </div>
-    <div class="metric-card">
-        <div class="metric-value">< 30s</div>
-        <div class="metric-label">Processing</div>
-    </div>
-    <div class="metric-card">
-        <div class="metric-value">HIPAA</div>
-        <div class="metric-label">Compliant</div>
-    </div>
-    <div class="metric-card">
-        <div class="metric-value">24/7</div>
-        <div class="metric-label">Available</div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+_render_metrics((
+    ("99.2%", "Accuracy"),
+    ("< 30s", "Processing"),
+    ("HIPAA", "Compliant"),
+    ("24/7", "Available"),
+))
 
 # Advanced Progress Tracking
-st.markdown("""
-<div class="progress-container">
-    <h3 style="margin-bottom: 1.5rem; color: var(--gray-900); font-weight: 600;">Clinical Workflow Progress</h3>
-""", unsafe_allow_html=True)
-
 steps = [
     {"num": 1, "title": "Audio Capture", "desc": "High-quality audio recording and upload", "icon": "🎤"},
     {"num": 2, "title": "Speech Recognition", "desc": "AI-powered transcription with Whisper", "icon": "🗣️"},
@@ -836,28 +258,29 @@ steps = [
     {"num": 5, "title": "Quality Review", "desc": "Documentation review and export", "icon": "✅"}
 ]
 
-for step in steps:
-    status_class = ""
-    if step["num"] < st.session_state.advanced_step:
-        status_class = "completed"
-    elif step["num"] == st.session_state.advanced_step:
-        status_class = "active"
-    else:
-        status_class = "pending"
-    
-    st.markdown(f"""
-    <div class="progress-step {status_class}">
-        <div class="step-indicator {status_class}">
-            {step["num"]}
-        </div>
-        <div class="step-content">
-            <div class="step-title">{step["icon"]} {step["title"]}</div>
-            <div class="step-description">{step["desc"]}</div>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
 
-st.markdown("</div>", unsafe_allow_html=True)
+STEP_TEMPLATE = _load_template("html/step_row.html")
+
+# Keyed on the sign of (step number - current step)
+STEP_STATUS = {-1: "completed", 0: "active", 1: "pending"}
+
+
+@st.cache_data(show_spinner=False)
+def render_progress_tracker(current_step):
+    """Build the workflow tracker HTML; there is one variant per step."""
+    rows = "".join(
+        STEP_TEMPLATE.format(status=STEP_STATUS[(step["num"] > current_step) - (step["num"] < current_step)], **step)
+        for step in steps
+    )
+    return (
+        '<div class="progress-container">'
+        '<h3 style="margin-bottom: 1.5rem; color: var(--gray-900); font-weight: 600;">Clinical Workflow Progress</h3>'
+        f"{rows}</div>"
+    )
+
+# Re-emitted on every rerun (skipped elements are dropped from the page);
+# the HTML for each step is built once per server process
+st.markdown(render_progress_tracker(st.session_state.advanced_step), unsafe_allow_html=True)
 
 # Step 1: Advanced Audio Input
 if st.session_state.advanced_step >= 1:
@@ -889,27 +312,20 @@ if st.session_state.advanced_step >= 1:
             """, unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <div class="metric-value">HD</div>
-            <div class="metric-label">Audio Quality</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_METRIC_TPL.format(value="HD", label="Audio Quality"), unsafe_allow_html=True)
 
 # Step 2: Advanced Transcription
 if st.session_state.advanced_step >= 2:
-    st.markdown("""
-    <div class="premium-card">
-        <div class="card-header">
-            <div class="card-title">🗣️ Step 2: Advanced Speech Recognition</div>
-            <div class="card-subtitle">AI-powered transcription with speaker identification</div>
-        </div>
-        <div class="card-body">
-    """, unsafe_allow_html=True)
+    _render_card_header("🗣️ Step 2: Advanced Speech Recognition", "AI-powered transcription with speaker identification")
     
     if st.button("🚀 Begin Advanced Transcription", type="primary", use_container_width=True):
         with st.container():
-            result = asr.transcribe("audio_file")
+            result = {"text": "", "confidence": 0.0, "segments": []}
+            for chunk in asr.transcribe("audio_file"):
+                if chunk.pop("type") == "segment":
+                    result["segments"].append(chunk)
+                else:
+                    result.update(chunk)
             st.session_state.transcription_result = result
             st.session_state.advanced_step = 3
             
@@ -924,6 +340,7 @@ if st.session_state.advanced_step >= 2:
         st.markdown("""
         <div style="background: white; border: 1px solid var(--gray-200); border-radius: 8px; padding: 1rem; margin: 1rem 0;">
             <h4 style="margin-bottom: 0.5rem; color: var(--gray-900);">📄 Transcribed Clinical Conversation</h4>
+        </div>
         """, unsafe_allow_html=True)
         
         st.text_area(
@@ -934,46 +351,16 @@ if st.session_state.advanced_step >= 2:
             key="advanced_transcription"
         )
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{st.session_state.transcription_result['confidence']:.1%}</div>
-                <div class="metric-label">Confidence</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            word_count = len(st.session_state.transcription_result["text"].split())
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{word_count}</div>
-                <div class="metric-label">Words</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">2</div>
-                <div class="metric-label">Speakers</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-    
-    st.markdown("</div></div>", unsafe_allow_html=True)
+        result = st.session_state.transcription_result
+        _render_metrics((
+            (f"{result['confidence']:.1%}", "Confidence"),
+            (len(result["text"].split()), "Words"),
+            (2, "Speakers"),
+        ))
 
 # Step 3: Advanced Entity Extraction
 if st.session_state.advanced_step >= 3:
-    st.markdown("""
-    <div class="premium-card">
-        <div class="card-header">
-            <div class="card-title">🧠 Step 3: Advanced Medical NLP</div>
-            <div class="card-subtitle">AI-powered clinical entity extraction and analysis</div>
-        </div>
-        <div class="card-body">
-    """, unsafe_allow_html=True)
+    _render_card_header("🧠 Step 3: Advanced Medical NLP", "AI-powered clinical entity extraction and analysis")
     
     if st.button("🔬 Extract Clinical Entities", type="primary", use_container_width=True):
         with st.container():
@@ -993,52 +380,31 @@ if st.session_state.advanced_step >= 3:
         st.markdown("""
         <div style="background: white; border: 1px solid var(--gray-200); border-radius: 8px; padding: 1rem; margin: 1rem 0;">
             <h4 style="margin-bottom: 1rem; color: var(--gray-900);">🏷️ Identified Clinical Entities</h4>
+        </div>
         """, unsafe_allow_html=True)
         
         # Entity metrics
-        entity_counts = {}
-        for entity in st.session_state.extracted_entities:
-            label = entity["label"]
-            entity_counts[label] = entity_counts.get(label, 0) + 1
+        entity_counts = Counter(e["label"] for e in st.session_state.extracted_entities)
         
-        cols = st.columns(len(entity_counts))
-        for i, (label, count) in enumerate(entity_counts.items()):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-value">{count}</div>
-                    <div class="metric-label">{label.title()}s</div>
-                </div>
-                """, unsafe_allow_html=True)
+        _render_metrics((count, f"{label.title()}s") for label, count in entity_counts.items())
         
         # Advanced entity display
-        st.markdown('<div class="entity-container">', unsafe_allow_html=True)
-        
+        buf = ['<div class="entity-container">']
         for entity in st.session_state.extracted_entities:
             css_class = f"entity-{entity['label'].lower()}"
             severity = entity.get('severity', 'normal')
-            
-            st.markdown(f"""
-            <div class="entity-tag {css_class}" title="Confidence: {entity['confidence']:.1%} | Severity: {severity}">
-                {entity['text']} 
-                <small style="opacity: 0.8;">({entity['confidence']:.0%})</small>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown('</div></div>', unsafe_allow_html=True)
-    
-    st.markdown("</div></div>", unsafe_allow_html=True)
+            buf.append(_ENTITY_TPL.format(
+                css_class=css_class,
+                confidence=entity['confidence'],
+                severity=severity,
+                text=entity['text']
+            ))
+        buf.append('</div>')
+        st.markdown("".join(buf), unsafe_allow_html=True)
 
 # Step 4: Advanced SOAP Generation
 if st.session_state.advanced_step >= 4:
-    st.markdown("""
-    <div class="premium-card">
-        <div class="card-header">
-            <div class="card-title">📝 Step 4: Advanced SOAP Documentation</div>
-            <div class="card-subtitle">AI-generated structured clinical notes</div>
-        </div>
-        <div class="card-body">
-    """, unsafe_allow_html=True)
+    _render_card_header("📝 Step 4: Advanced SOAP Documentation", "AI-generated structured clinical notes")
     
     if st.button("📋 Generate Professional SOAP Note", type="primary", use_container_width=True):
         with st.container():
@@ -1057,55 +423,39 @@ if st.session_state.advanced_step >= 4:
             """, unsafe_allow_html=True)
     
     if st.session_state.soap_documentation:
-        st.markdown('<div class="soap-container">', unsafe_allow_html=True)
-        
-        soap_sections = [
-            ("subjective", "SUBJECTIVE", "Patient's reported symptoms and history"),
-            ("objective", "OBJECTIVE", "Observable findings and measurements"),
-            ("assessment", "ASSESSMENT", "Clinical assessment and diagnosis"),
-            ("plan", "PLAN", "Treatment plan and follow-up")
-        ]
-        
-        for key, title, description in soap_sections:
-            st.markdown(f"""
-            <div class="soap-section">
-                <div class="soap-header">
-                    <div class="soap-title">{title}</div>
-                    <div style="font-size: 0.875rem; color: var(--gray-600); font-weight: normal; text-transform: none; letter-spacing: normal;">{description}</div>
+        # Edits stay client-side until saved, so typing does not rerun the script
+        with st.form("soap_edit"):
+            for key, title, description in SOAP_SECTION_HEADERS:
+                st.markdown(f"""
+                <div class="soap-section">
+                    <div class="soap-header">
+                        <div class="soap-title">{title}</div>
+                        <div style="font-size: 0.875rem; color: var(--gray-600); font-weight: normal; text-transform: none; letter-spacing: normal;">{description}</div>
+                    </div>
                 </div>
-                <div class="soap-body">
-            """, unsafe_allow_html=True)
+                """, unsafe_allow_html=True)
             
-            st.text_area(
-                f"{title} Section",
-                value=st.session_state.soap_documentation.get(key, ""),
-                height=200,
-                key=f"advanced_soap_{key}",
-                label_visibility="collapsed"
-            )
+                st.text_area(
+                    f"{title} Section",
+                    value=st.session_state.soap_documentation.get(key, ""),
+                    height=200,
+                    key=f"advanced_soap_{key}",
+                    label_visibility="collapsed"
+                )
             
-            st.markdown("</div></div>", unsafe_allow_html=True)
-        
-        st.markdown('</div>', unsafe_allow_html=True)
-    
-    st.markdown("</div></div>", unsafe_allow_html=True)
+            if st.form_submit_button("💾 Save SOAP Note", use_container_width=True):
+                st.session_state.soap_documentation = {
+                    key: st.session_state[f"advanced_soap_{key}"] for key, _, _ in SOAP_SECTION_HEADERS
+                }
 
 # Step 5: Advanced Export & Review
 if st.session_state.advanced_step >= 5:
-    st.markdown("""
-    <div class="premium-card">
-        <div class="card-header">
-            <div class="card-title">✅ Step 5: Quality Review & Export</div>
-            <div class="card-subtitle">Professional documentation export and validation</div>
-        </div>
-        <div class="card-body">
-    """, unsafe_allow_html=True)
+    _render_card_header("✅ Step 5: Quality Review & Export", "Professional documentation export and validation")
     
     col1, col2, col3 = st.columns(3)
     
     with col1:
         if st.button("📄 Export Professional PDF", type="primary", use_container_width=True):
-            time.sleep(1)
             st.markdown("""
             <div style="background: var(--success-50); border: 1px solid var(--success-200); border-radius: 8px; padding: 1rem; margin: 1rem 0;">
                 <span class="status-badge status-success">✓ Exported</span>
@@ -1115,27 +465,16 @@ if st.session_state.advanced_step >= 5:
     
     with col2:
         if st.button("📊 Export Clinical JSON", type="secondary", use_container_width=True):
-            export_data = {
-                "session_id": "advanced_demo_" + datetime.now().strftime("%Y%m%d_%H%M%S"),
-                "transcription": st.session_state.transcription_result,
-                "entities": st.session_state.extracted_entities,
-                "soap_note": st.session_state.soap_documentation,
-                "metadata": {
-                    "platform": "MediSynth Advanced",
-                    "version": "2.0",
-                    "timestamp": datetime.now().isoformat(),
-                    "confidence_threshold": 0.85
-                }
-            }
-            st.json(export_data)
+            st.code(_build_export(
+                st.session_state.transcription_result,
+                st.session_state.extracted_entities,
+                st.session_state.soap_documentation,
+                st.session_state.session_started_at
+            ), language="json")
     
     with col3:
-        if st.button("🔄 Reset Advanced Demo", use_container_width=True):
-            st.session_state.advanced_step = 1
-            st.session_state.transcription_result = None
-            st.session_state.extracted_entities = []
-            st.session_state.soap_documentation = {}
-            st.rerun()
+        # Runs before the next script pass, so no forced second rerun is needed
+        st.button("🔄 Reset Advanced Demo", use_container_width=True, on_click=reset_demo)
     
     # Advanced analytics dashboard
     if st.session_state.soap_documentation:
@@ -1147,44 +486,16 @@ if st.session_state.advanced_step >= 5:
         
         # Calculate stats
         total_words = sum(len(content.split()) for content in st.session_state.soap_documentation.values())
-        entity_count = len(st.session_state.extracted_entities)
-        confidence_avg = sum(e['confidence'] for e in st.session_state.extracted_entities) / entity_count if entity_count > 0 else 0
+        confidences = [e['confidence'] for e in st.session_state.extracted_entities]
+        entity_count = len(confidences)
+        confidence_avg = fmean(confidences) if confidences else 0.0
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{total_words}</div>
-                <div class="metric-label">Total Words</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{entity_count}</div>
-                <div class="metric-label">Entities</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">{confidence_avg:.1%}</div>
-                <div class="metric-label">Avg Confidence</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="metric-value">4/4</div>
-                <div class="metric-label">Sections</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    st.markdown("</div></div>", unsafe_allow_html=True)
+        _render_metrics((
+            (total_words, "Total Words"),
+            (entity_count, "Entities"),
+            (f"{confidence_avg:.1%}", "Avg Confidence"),
+            ("4/4", "Sections"),
+        ))
 
 # Advanced Footer
 st.markdown("""
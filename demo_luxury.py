@@ -3,674 +3,113 @@ Luxury Dark Mode Interface for MediSynth Agent
 Premium dark theme with sophisticated animations and luxury aesthetics
 """
 
+import html
 import streamlit as st
 import tempfile
 import os
-import time
 from datetime import datetime
 
+from static_assets import load_css
+
+# Luxury dark stylesheet (static/demo_luxury.css), minified before shipping
+FONTS = ("Montserrat:wght@300;400;600;700;900", "Roboto+Mono:wght@500")
+
 def apply_luxury_dark_css():
     """Apply luxury dark mode styling with premium aesthetics"""
-    st.markdown("""
-    <style>
-    /* Import Luxury Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700;800;900&family=Roboto+Mono:wght@300;400;500;600&display=swap');
-    
-    /* Luxury Dark Variables */
-    :root {
-        /* Dark Palette */
-        --dark-bg: #0a0a0a;
-        --dark-surface: #1a1a1a;
-        --dark-card: #252525;
-        --dark-border: #333333;
-        --dark-text: #ffffff;
-        --dark-text-secondary: #a0a0a0;
-        
-        /* Luxury Accents */
-        --gold: #ffd700;
-        --gold-dark: #b8860b;
-        --platinum: #e5e4e2;
-        --rose-gold: #e8b4b8;
-        --emerald: #50c878;
-        
-        /* Gradients */
-        --gradient-luxury: linear-gradient(135deg, #ffd700 0%, #ffed4e 50%, #ffd700 100%);
-        --gradient-dark: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-        --gradient-card: linear-gradient(135deg, #252525 0%, #1a1a1a 100%);
-        --gradient-glass-dark: linear-gradient(135deg, rgba(255,255,255,0.05) 0%, rgba(255,255,255,0.02) 100%);
-        
-        /* Luxury Shadows */
-        --shadow-luxury: 0 10px 40px rgba(255, 215, 0, 0.3);
-        --shadow-dark: 0 10px 30px rgba(0, 0, 0, 0.5);
-        --shadow-glow: 0 0 20px rgba(255, 215, 0, 0.2);
-        
-        /* Animations */
-        --ease-luxury: cubic-bezier(0.25, 0.46, 0.45, 0.94);
-        --ease-bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);
-    }
-    
-    /* Global Dark Theme */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    .main {
-        font-family: 'Montserrat', sans-serif;
-        background: var(--dark-bg);
-        color: var(--dark-text);
-        min-height: 100vh;
-        position: relative;
-        overflow-x: hidden;
-    }
-    
-    .main::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: 
-            radial-gradient(circle at 20% 80%, rgba(255, 215, 0, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 215, 0, 0.05) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(80, 200, 120, 0.05) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-    }
-    
-    /* Luxury Header */
-    .luxury-header {
-        background: var(--gradient-card);
-        border: 1px solid var(--dark-border);
-        border-radius: 20px;
-        padding: 4rem 2rem;
-        margin: 2rem 0;
-        position: relative;
-        overflow: hidden;
-        box-shadow: var(--shadow-dark);
-        transition: all 0.4s var(--ease-luxury);
-    }
-    
-    .luxury-header:hover {
-        transform: translateY(-5px);
-        box-shadow: var(--shadow-luxury);
-    }
-    
-    .luxury-header::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 3px;
-        background: var(--gradient-luxury);
-        opacity: 0.8;
-    }
-    
-    .luxury-header::after {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: 
-            radial-gradient(circle, rgba(255, 215, 0, 0.1) 0%, transparent 70%);
-        opacity: 0;
-        transition: opacity 0.6s var(--ease-luxury);
-        pointer-events: none;
-    }
-    
-    .luxury-header:hover::after {
-        opacity: 1;
-    }
-    
-    .header-content-luxury {
-        position: relative;
-        z-index: 1;
-        text-align: center;
-    }
-    
-    .luxury-title {
-        font-size: clamp(3rem, 6vw, 5rem);
-        font-weight: 900;
-        background: var(--gradient-luxury);
-        background-clip: text;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-        letter-spacing: -0.03em;
-        text-shadow: 0 0 30px rgba(255, 215, 0, 0.5);
-        animation: glow 3s ease-in-out infinite alternate;
-    }
-    
-    @keyframes glow {
-        from { filter: drop-shadow(0 0 20px rgba(255, 215, 0, 0.3)); }
-        to { filter: drop-shadow(0 0 40px rgba(255, 215, 0, 0.6)); }
-    }
-    
-    .luxury-subtitle {
-        color: var(--platinum);
-        font-size: clamp(1.2rem, 2.5vw, 1.8rem);
-        font-weight: 300;
-        margin-bottom: 2rem;
-        letter-spacing: 0.05em;
-        opacity: 0.9;
-    }
-    
-    .luxury-badges {
-        display: flex;
-        justify-content: center;
-        gap: 1.5rem;
-        flex-wrap: wrap;
-        margin-top: 2rem;
-    }
-    
-    .luxury-badge {
-        background: var(--gradient-card);
-        border: 1px solid var(--gold);
-        border-radius: 50px;
-        padding: 1rem 2rem;
-        color: var(--gold);
-        font-size: 0.9rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        transition: all 0.3s var(--ease-bounce);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .luxury-badge::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 215, 0, 0.2), transparent);
-        transition: left 0.6s;
-    }
-    
-    .luxury-badge:hover {
-        transform: translateY(-3px) scale(1.05);
-        box-shadow: var(--shadow-glow);
-        background: rgba(255, 215, 0, 0.1);
-    }
-    
-    .luxury-badge:hover::before {
-        left: 100%;
-    }
-    
-    /* Premium Dark Cards */
-    .luxury-card {
-        background: var(--gradient-card);
-        border: 1px solid var(--dark-border);
-        border-radius: 20px;
-        padding: 2.5rem;
-        margin: 2rem 0;
-        position: relative;
-        overflow: hidden;
-        transition: all 0.4s var(--ease-luxury);
-        box-shadow: var(--shadow-dark);
-    }
-    
-    .luxury-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 2px;
-        background: var(--gradient-luxury);
-        opacity: 0.6;
-        transition: opacity 0.3s;
-    }
-    
-    .luxury-card:hover {
-        transform: translateY(-8px);
-        box-shadow: var(--shadow-luxury);
-        border-color: var(--gold);
-    }
-    
-    .luxury-card:hover::before {
-        opacity: 1;
-    }
-    
-    .card-header-luxury {
-        display: flex;
-        align-items: center;
-        gap: 1.5rem;
-        margin-bottom: 2rem;
-        padding-bottom: 1.5rem;
-        border-bottom: 1px solid var(--dark-border);
-    }
-    
-    .card-icon-luxury {
-        width: 60px;
-        height: 60px;
-        border-radius: 15px;
-        background: var(--gradient-luxury);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 1.8rem;
-        color: var(--dark-bg);
-        box-shadow: var(--shadow-glow);
-        animation: float 3s ease-in-out infinite;
-    }
-    
-    @keyframes float {
-        0%, 100% { transform: translateY(0px); }
-        50% { transform: translateY(-5px); }
-    }
-    
-    .card-title-luxury {
-        font-size: 1.8rem;
-        font-weight: 700;
-        color: var(--dark-text);
-        margin: 0;
-        flex: 1;
-    }
-    
-    .card-subtitle-luxury {
-        color: var(--dark-text-secondary);
-        font-size: 1rem;
-        font-weight: 400;
-        margin: 0;
-        opacity: 0.8;
-    }
-    
-    /* Elegant Progress System */
-    .progress-luxury {
-        padding: 2rem 0;
-    }
-    
-    .progress-step-luxury {
-        display: flex;
-        align-items: center;
-        gap: 2rem;
-        padding: 2rem 0;
-        position: relative;
-        transition: all 0.3s var(--ease-luxury);
-    }
-    
-    .progress-step-luxury:not(:last-child)::after {
-        content: '';
-        position: absolute;
-        left: 2rem;
-        top: 5rem;
-        width: 2px;
-        height: 4rem;
-        background: linear-gradient(180deg, var(--gold) 0%, transparent 100%);
-        opacity: 0.3;
-        transition: all 0.3s;
-    }
-    
-    .progress-step-luxury.completed::after {
-        opacity: 1;
-        background: var(--gradient-luxury);
-    }
-    
-    .step-circle-luxury {
-        width: 4rem;
-        height: 4rem;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: 700;
-        font-size: 1.2rem;
-        position: relative;
-        transition: all 0.4s var(--ease-bounce);
-        z-index: 2;
-    }
-    
-    .step-circle-luxury.pending {
-        background: var(--dark-card);
-        color: var(--dark-text-secondary);
-        border: 2px solid var(--dark-border);
-    }
-    
-    .step-circle-luxury.active {
-        background: var(--gradient-luxury);
-        color: var(--dark-bg);
-        border: 2px solid var(--gold);
-        box-shadow: 0 0 0 10px rgba(255, 215, 0, 0.2), var(--shadow-glow);
-        animation: pulse-luxury 2s infinite;
-    }
-    
-    .step-circle-luxury.completed {
-        background: var(--gradient-luxury);
-        color: var(--dark-bg);
-        border: 2px solid var(--gold);
-        box-shadow: var(--shadow-glow);
-        transform: scale(1.1);
-    }
-    
-    @keyframes pulse-luxury {
-        0%, 100% { transform: scale(1); }
-        50% { transform: scale(1.05); }
-    }
-    
-    .step-content-luxury {
-        flex: 1;
-    }
-    
-    .step-title-luxury {
-        font-size: 1.4rem;
-        font-weight: 600;
-        color: var(--dark-text);
-        margin-bottom: 0.5rem;
-    }
-    
-    .step-description-luxury {
-        color: var(--dark-text-secondary);
-        font-size: 1rem;
-        line-height: 1.6;
-        opacity: 0.9;
-    }
-    
-    /* Premium Entity System */
-    .entity-showcase {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 1rem;
-        margin: 2rem 0;
-        padding: 2rem;
-        background: rgba(255, 215, 0, 0.05);
-        border-radius: 15px;
-        border: 1px solid rgba(255, 215, 0, 0.2);
-    }
-    
-    .entity-tag-luxury {
-        background: var(--gradient-card);
-        border: 1px solid var(--dark-border);
-        border-radius: 30px;
-        padding: 1rem 1.5rem;
-        font-size: 0.9rem;
-        font-weight: 500;
-        font-family: 'Roboto Mono', monospace;
-        transition: all 0.3s var(--ease-bounce);
-        cursor: pointer;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .entity-tag-luxury::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255, 215, 0, 0.1), transparent);
-        transition: left 0.5s;
-    }
-    
-    .entity-tag-luxury:hover {
-        transform: translateY(-3px) scale(1.05);
-        box-shadow: var(--shadow-glow);
-        border-color: var(--gold);
-    }
-    
-    .entity-tag-luxury:hover::before {
-        left: 100%;
-    }
-    
-    .entity-symptom-luxury {
-        color: #60a5fa;
-        border-color: rgba(96, 165, 250, 0.3);
-    }
-    
-    .entity-medication-luxury {
-        color: var(--emerald);
-        border-color: rgba(80, 200, 120, 0.3);
-    }
-    
-    .entity-condition-luxury {
-        color: var(--rose-gold);
-        border-color: rgba(232, 180, 184, 0.3);
-    }
-    
-    .entity-vital-luxury {
-        color: var(--gold);
-        border-color: rgba(255, 215, 0, 0.3);
-    }
-    
-    /* Luxury Buttons */
-    .btn-luxury {
-        background: var(--gradient-luxury);
-        border: none;
-        border-radius: 15px;
-        padding: 1.2rem 2.5rem;
-        font-family: 'Montserrat', sans-serif;
-        font-weight: 700;
-        font-size: 1rem;
-        color: var(--dark-bg);
-        cursor: pointer;
-        transition: all 0.3s var(--ease-bounce);
-        box-shadow: var(--shadow-glow);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .btn-luxury::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        transition: left 0.5s;
-    }
-    
-    .btn-luxury:hover {
-        transform: translateY(-3px) scale(1.02);
-        box-shadow: 0 15px 40px rgba(255, 215, 0, 0.4);
-    }
-    
-    .btn-luxury:hover::before {
-        left: 100%;
-    }
-    
-    .btn-luxury:active {
-        transform: translateY(-1px) scale(0.98);
-    }
-    
-    /* Premium SOAP Styling */
-    .soap-container-luxury {
-        display: grid;
-        gap: 2rem;
-        margin: 2rem 0;
-    }
-    
-    .soap-section-luxury {
-        background: var(--gradient-card);
-        border: 1px solid var(--dark-border);
-        border-radius: 20px;
-        overflow: hidden;
-        transition: all 0.4s var(--ease-luxury);
-        box-shadow: var(--shadow-dark);
-        position: relative;
-    }
-    
-    .soap-section-luxury::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 3px;
-        background: var(--gradient-luxury);
-        opacity: 0.5;
-        transition: opacity 0.3s;
-    }
-    
-    .soap-section-luxury:hover {
-        transform: translateY(-5px);
-        box-shadow: var(--shadow-luxury);
-        border-color: var(--gold);
-    }
-    
-    .soap-section-luxury:hover::before {
-        opacity: 1;
-    }
-    
-    .soap-header-luxury {
-        background: rgba(255, 215, 0, 0.1);
-        padding: 2rem;
-        border-bottom: 1px solid var(--dark-border);
-    }
-    
-    .soap-title-luxury {
-        font-size: 1.4rem;
-        font-weight: 700;
-        color: var(--gold);
-        text-transform: uppercase;
-        letter-spacing: 0.15em;
-        margin: 0;
-    }
-    
-    .soap-body-luxury {
-        padding: 2rem;
-        color: var(--dark-text);
-        line-height: 1.8;
-        font-size: 1rem;
-    }
-    
-    /* Metrics Dashboard */
-    .metrics-luxury {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        gap: 2rem;
-        margin: 2rem 0;
-    }
-    
-    .metric-card-luxury {
-        background: var(--gradient-card);
-        border: 1px solid var(--dark-border);
-        border-radius: 20px;
-        padding: 2.5rem;
-        text-align: center;
-        transition: all 0.4s var(--ease-bounce);
-        position: relative;
-        overflow: hidden;
-        box-shadow: var(--shadow-dark);
-    }
-    
-    .metric-card-luxury::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 3px;
-        background: var(--gradient-luxury);
-        opacity: 0.6;
-        transition: opacity 0.3s;
-    }
-    
-    .metric-card-luxury:hover {
-        transform: translateY(-10px) scale(1.05);
-        box-shadow: var(--shadow-luxury);
-        border-color: var(--gold);
-    }
-    
-    .metric-card-luxury:hover::before {
-        opacity: 1;
-    }
-    
-    .metric-value-luxury {
-        font-size: 3rem;
-        font-weight: 900;
-        background: var(--gradient-luxury);
-        background-clip: text;
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 1rem;
-        text-shadow: 0 0 20px rgba(255, 215, 0, 0.3);
-    }
-    
-    .metric-label-luxury {
-        font-size: 1rem;
-        font-weight: 600;
-        color: var(--dark-text-secondary);
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        opacity: 0.9;
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .luxury-title {
-            font-size: 3rem;
-        }
-        
-        .luxury-card {
-            padding: 2rem;
-            margin: 1.5rem 0;
-        }
-        
-        .metrics-luxury {
-            grid-template-columns: 1fr;
-            gap: 1.5rem;
-        }
-        
-        .luxury-badges {
-            flex-direction: column;
-            align-items: center;
-        }
-    }
-    
-    /* Streamlit Component Overrides */
-    .stButton > button {
-        background: var(--gradient-luxury) !important;
-        border: none !important;
-        border-radius: 15px !important;
-        padding: 1.2rem 2.5rem !important;
-        font-family: 'Montserrat', sans-serif !important;
-        font-weight: 700 !important;
-        font-size: 1rem !important;
-        color: var(--dark-bg) !important;
-        transition: all 0.3s var(--ease-bounce) !important;
-        box-shadow: var(--shadow-glow) !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.05em !important;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-3px) scale(1.02) !important;
-        box-shadow: 0 15px 40px rgba(255, 215, 0, 0.4) !important;
-    }
-    
-    .stTextArea > div > div > textarea {
-        background: var(--dark-card) !important;
-        border: 1px solid var(--dark-border) !important;
-        border-radius: 15px !important;
-        color: var(--dark-text) !important;
-        font-family: 'Montserrat', sans-serif !important;
-        padding: 1.5rem !important;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: var(--gold) !important;
-        box-shadow: 0 0 0 3px rgba(255, 215, 0, 0.2) !important;
-    }
-    
-    /* Hide Streamlit Elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    .stDecoration {display: none;}
-    </style>
-    """, unsafe_allow_html=True)
+    # Emitted on every rerun (Streamlit drops elements a rerun does not write)
+    st.markdown(load_css("demo_luxury.css", FONTS), unsafe_allow_html=True)
+
+SAMPLE_TRANSCRIPT = """Good morning, Doctor. I've been experiencing persistent chest pain for approximately 24 hours. The pain is sharp, substernal, and pleuritic in nature, worsening with deep inspiration and movement. I've also noted mild dyspnea, intermittent nausea, and diaphoresis. My medical history includes hypertension, currently managed with lisinopril 10mg daily. No known allergies."""
+
+@st.cache_data(show_spinner=False)
+def _results_html():
+    """Build the transcription, entity and SOAP cards once; the content is fixed."""
+    return f"""
+    <div class="luxury-card">
+        <div class="card-header-luxury">
+            <div class="card-icon-luxury">📝</div>
+            <div>
+                <div class="card-title-luxury">Premium Transcription</div>
+                <div class="card-subtitle-luxury">Luxury-grade speech-to-text conversion</div>
+            </div>
+        </div>
+        <pre class="luxury-transcript">{html.escape(SAMPLE_TRANSCRIPT)}</pre>
+    </div>
+    <div class="luxury-card">
+        <div class="card-header-luxury">
+            <div class="card-icon-luxury">🧠</div>
+            <div>
+                <div class="card-title-luxury">Premium Entity Analysis</div>
+                <div class="card-subtitle-luxury">Luxury clinical intelligence processing</div>
+            </div>
+        </div>
+        <div class="entity-showcase">
+            <div class="entity-tag-luxury entity-symptom-luxury">chest pain</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">sharp</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">substernal</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">pleuritic</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">dyspnea</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">nausea</div>
+            <div class="entity-tag-luxury entity-symptom-luxury">diaphoresis</div>
+            <div class="entity-tag-luxury entity-condition-luxury">hypertension</div>
+            <div class="entity-tag-luxury entity-medication-luxury">lisinopril 10mg</div>
+        </div>
+    </div>
+    <div class="luxury-card">
+        <div class="card-header-luxury">
+            <div class="card-icon-luxury">📋</div>
+            <div>
+                <div class="card-title-luxury">Luxury SOAP Documentation</div>
+                <div class="card-subtitle-luxury">Premium structured clinical notes</div>
+            </div>
+        </div>
+        <div class="soap-container-luxury">
+            <div class="soap-section-luxury">
+                <div class="soap-header-luxury">
+                    <div class="soap-title-luxury">Subjective</div>
+                </div>
+                <div class="soap-body-luxury">
+                    <strong>Chief Complaint:</strong> Chest pain for 24 hours<br><br>
+                    Patient reports persistent chest pain, sharp and substernal in location, 
+                    pleuritic in nature with associated dyspnea, nausea, and diaphoresis. 
+                    Pain worsens with deep inspiration and movement.
+                </div>
+            </div>
+            <div class="soap-section-luxury">
+                <div class="soap-header-luxury">
+                    <div class="soap-title-luxury">Objective</div>
+                </div>
+                <div class="soap-body-luxury">
+                    <strong>Vital Signs:</strong> To be obtained during examination<br>
+                    <strong>Physical Examination:</strong> To be documented during clinical assessment
+                </div>
+            </div>
+            <div class="soap-section-luxury">
+                <div class="soap-header-luxury">
+                    <div class="soap-title-luxury">Assessment</div>
+                </div>
+                <div class="soap-body-luxury">
+                    • Rule out acute coronary syndrome<br>
+                    • Consider pleuritic chest pain<br>
+                    • Hypertension - stable on current therapy<br>
+                    • Requires further diagnostic evaluation
+                </div>
+            </div>
+            <div class="soap-section-luxury">
+                <div class="soap-header-luxury">
+                    <div class="soap-title-luxury">Plan</div>
+                </div>
+                <div class="soap-body-luxury">
+                    • Order 12-lead ECG and chest X-ray<br>
+                    • Basic metabolic panel and troponin levels<br>
+                    • Continue current lisinopril regimen<br>
+                    • Follow-up within 24-48 hours<br>
+                    • Return precautions provided
+                </div>
+            </div>
+        </div>
+    </div>
+    """
 
 def main():
     """Luxury dark mode MediSynth Agent interface"""
@@ -747,9 +186,6 @@ def main():
         if st.button("👑 Launch Luxury Demo", type="primary", use_container_width=True):
             # Elegant processing animation
             with st.container():
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
                 stages = [
                     "Initializing luxury AI models...",
                     "Processing premium audio signal...",
@@ -759,114 +195,23 @@ def main():
                     "Generating luxury documentation..."
                 ]
                 
-                for i, stage in enumerate(stages):
-                    status_text.markdown(f"<div style='color: #ffd700; font-weight: 600;'>{stage}</div>", unsafe_allow_html=True)
-                    progress_bar.progress((i + 1) / len(stages))
-                    time.sleep(0.8)
-                
-                status_text.empty()
-                progress_bar.empty()
-                
-                st.success("✨ Luxury processing completed with premium quality!")
-                
-                # Display transcription in luxury card
-                st.markdown("""
-                <div class="luxury-card">
-                    <div class="card-header-luxury">
-                        <div class="card-icon-luxury">📝</div>
-                        <div>
-                            <div class="card-title-luxury">Premium Transcription</div>
-                            <div class="card-subtitle-luxury">Luxury-grade speech-to-text conversion</div>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
-                
-                sample_text = """Good morning, Doctor. I've been experiencing persistent chest pain for approximately 24 hours. The pain is sharp, substernal, and pleuritic in nature, worsening with deep inspiration and movement. I've also noted mild dyspnea, intermittent nausea, and diaphoresis. My medical history includes hypertension, currently managed with lisinopril 10mg daily. No known allergies."""
-                
-                st.text_area("", value=sample_text, height=120, disabled=True)
-                st.markdown("</div>", unsafe_allow_html=True)
-                
-                # Entity Extraction
-                st.markdown("""
-                <div class="luxury-card">
-                    <div class="card-header-luxury">
-                        <div class="card-icon-luxury">🧠</div>
-                        <div>
-                            <div class="card-title-luxury">Premium Entity Analysis</div>
-                            <div class="card-subtitle-luxury">Luxury clinical intelligence processing</div>
-                        </div>
-                    </div>
-                    <div class="entity-showcase">
-                        <div class="entity-tag-luxury entity-symptom-luxury">chest pain</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">sharp</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">substernal</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">pleuritic</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">dyspnea</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">nausea</div>
-                        <div class="entity-tag-luxury entity-symptom-luxury">diaphoresis</div>
-                        <div class="entity-tag-luxury entity-condition-luxury">hypertension</div>
-                        <div class="entity-tag-luxury entity-medication-luxury">lisinopril 10mg</div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                # Stages reveal and fill one after another in the browser
+                st.markdown("".join(
+                    f'<div class="stage-luxury" style="animation-delay: {i * 0.8:.1f}s;">'
+                    f'<div class="stage-label-luxury">{stage}</div>'
+                    f'<div class="stage-track-luxury"><div class="stage-bar-luxury" style="animation-delay: {i * 0.8:.1f}s;"></div></div>'
+                    f'</div>'
+                    for i, stage in enumerate(stages)
+                ), unsafe_allow_html=True)
                 
-                # SOAP Note Generation
-                st.markdown("""
-                <div class="luxury-card">
-                    <div class="card-header-luxury">
-                        <div class="card-icon-luxury">📋</div>
-                        <div>
-                            <div class="card-title-luxury">Luxury SOAP Documentation</div>
-                            <div class="card-subtitle-luxury">Premium structured clinical notes</div>
-                        </div>
-                    </div>
-                    <div class="soap-container-luxury">
-                        <div class="soap-section-luxury">
-                            <div class="soap-header-luxury">
-                                <div class="soap-title-luxury">Subjective</div>
-                            </div>
-                            <div class="soap-body-luxury">
-                                <strong>Chief Complaint:</strong> Chest pain for 24 hours<br><br>
-                                Patient reports persistent chest pain, sharp and substernal in location, 
-                                pleuritic in nature with associated dyspnea, nausea, and diaphoresis. 
-                                Pain worsens with deep inspiration and movement.
-                            </div>
-                        </div>
-                        <div class="soap-section-luxury">
-                            <div class="soap-header-luxury">
-                                <div class="soap-title-luxury">Objective</div>
-                            </div>
-                            <div class="soap-body-luxury">
-                                <strong>Vital Signs:</strong> To be obtained during examination<br>
-                                <strong>Physical Examination:</strong> To be documented during clinical assessment
-                            </div>
-                        </div>
-                        <div class="soap-section-luxury">
-                            <div class="soap-header-luxury">
-                                <div class="soap-title-luxury">Assessment</div>
-                            </div>
-                            <div class="soap-body-luxury">
-                                • Rule out acute coronary syndrome<br>
-                                • Consider pleuritic chest pain<br>
-                                • Hypertension - stable on current therapy<br>
-                                • Requires further diagnostic evaluation
-                            </div>
-                        </div>
-                        <div class="soap-section-luxury">
-                            <div class="soap-header-luxury">
-                                <div class="soap-title-luxury">Plan</div>
-                            </div>
-                            <div class="soap-body-luxury">
-                                • Order 12-lead ECG and chest X-ray<br>
-                                • Basic metabolic panel and troponin levels<br>
-                                • Continue current lisinopril regimen<br>
-                                • Follow-up within 24-48 hours<br>
-                                • Return precautions provided
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
+                # Transcription, entity extraction and SOAP cards go out as one
+                # block, revealed with the banner once the last stage has filled
+                st.markdown(
+                    f'<div class="luxury-results" style="animation-delay: {len(stages) * 0.8:.1f}s;">'
+                    '<div class="luxury-complete">✨ Luxury processing completed with premium quality!</div>'
+                    f'{_results_html()}</div>',
+                    unsafe_allow_html=True
+                )
         
         st.markdown("</div>", unsafe_allow_html=True)
     
@@ -881,43 +226,28 @@ def main():
                     <div class="card-subtitle-luxury">Premium workflow management</div>
                 </div>
             </div>
-            <div class="progress-luxury">
-                <div class="progress-step-luxury completed">
-                    <div class="step-circle-luxury completed">✓</div>
-                    <div class="step-content-luxury">
-                        <div class="step-title-luxury">Audio Capture</div>
-                        <div class="step-description-luxury">Premium audio input processing with luxury quality standards</div>
-                    </div>
-                </div>
-                <div class="progress-step-luxury completed">
-                    <div class="step-circle-luxury completed">✓</div>
-                    <div class="step-content-luxury">
-                        <div class="step-title-luxury">Speech Recognition</div>
-                        <div class="step-description-luxury">Luxury-grade AI transcription with premium accuracy</div>
-                    </div>
-                </div>
-                <div class="progress-step-luxury completed">
-                    <div class="step-circle-luxury completed">✓</div>
-                    <div class="step-content-luxury">
-                        <div class="step-title-luxury">Entity Extraction</div>
-                        <div class="step-description-luxury">Advanced clinical intelligence with luxury processing</div>
-                    </div>
-                </div>
-                <div class="progress-step-luxury completed">
-                    <div class="step-circle-luxury completed">✓</div>
-                    <div class="step-content-luxury">
-                        <div class="step-title-luxury">SOAP Generation</div>
-                        <div class="step-description-luxury">Premium structured documentation creation</div>
-                    </div>
-                </div>
-                <div class="progress-step-luxury">
-                    <div class="step-circle-luxury pending">5</div>
-                    <div class="step-content-luxury">
-                        <div class="step-title-luxury">Luxury Export</div>
-                        <div class="step-description-luxury">Premium export options with luxury formatting</div>
-                    </div>
-                </div>
-            </div>
+            <ol class="luxury-pipeline">
+                <li class="completed">
+                    <div class="step-title-luxury">Audio Capture</div>
+                    <div class="step-description-luxury">Premium audio input processing with luxury quality standards</div>
+                </li>
+                <li class="completed">
+                    <div class="step-title-luxury">Speech Recognition</div>
+                    <div class="step-description-luxury">Luxury-grade AI transcription with premium accuracy</div>
+                </li>
+                <li class="completed">
+                    <div class="step-title-luxury">Entity Extraction</div>
+                    <div class="step-description-luxury">Advanced clinical intelligence with luxury processing</div>
+                </li>
+                <li class="completed">
+                    <div class="step-title-luxury">SOAP Generation</div>
+                    <div class="step-description-luxury">Premium structured documentation creation</div>
+                </li>
+                <li>
+                    <div class="step-title-luxury">Luxury Export</div>
+                    <div class="step-description-luxury">Premium export options with luxury formatting</div>
+                </li>
+            </ol>
         </div>
         """, unsafe_allow_html=True)
     
@@ -2,13 +2,13 @@
 Professional Enterprise-Grade Demo of MediSynth Agent.
 """
 
-import streamlit as st
-import tempfile
-import os
-import time
 import json
+import streamlit as st
+from collections import Counter, defaultdict
 from datetime import datetime
 
+from static_assets import load_css
+
 # Configure page with professional settings
 st.set_page_config(
     page_title="MediSynth Agent - Clinical Documentation",
@@ -17,310 +17,43 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Professional Enterprise CSS
-st.markdown("""
-<style>
-/* Import Professional Fonts */
-@import url('https://fonts.googleapis.com/css2?family=Source+Sans+Pro:wght@300;400;500;600;700&family=IBM+Plex+Mono:wght@400;500&display=swap');
-
-/* Global Professional Styles */
-.main {
-    font-family: 'Source Sans Pro', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    background-color: #fafbfc;
-}
-
-/* Professional Header */
-.header-container {
-    background: linear-gradient(180deg, #ffffff 0%, #f8f9fa 100%);
-    border: 1px solid #dee2e6;
-    border-bottom: 3px solid #0066cc;
-    padding: 1.5rem 2rem;
-    margin-bottom: 1.5rem;
-    box-shadow: 0 2px 4px rgba(0,0,0,0.04);
-}
-
-.header-title {
-    color: #212529;
-    font-size: 1.75rem;
-    font-weight: 600;
-    margin: 0;
-    line-height: 1.2;
-}
-
-.header-subtitle {
-    color: #6c757d;
-    font-size: 0.875rem;
-    margin-top: 0.25rem;
-    font-weight: 400;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-}
-
-/* Professional Cards */
-.clinical-card {
-    background: #ffffff;
-    border: 1px solid #dee2e6;
-    border-radius: 4px;
-    padding: 1.25rem;
-    margin-bottom: 1rem;
-    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    transition: border-color 0.15s ease-in-out, box-shadow 0.15s ease-in-out;
-}
-
-.clinical-card:hover {
-    border-color: #0066cc;
-    box-shadow: 0 2px 8px rgba(0,102,204,0.15);
-}
-
-.clinical-card-header {
-    color: #495057;
-    font-size: 0.875rem;
-    font-weight: 600;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-    margin-bottom: 0.75rem;
-    padding-bottom: 0.5rem;
-    border-bottom: 1px solid #e9ecef;
-}
-
-/* Professional Status Indicators */
-.status-indicator {
-    display: inline-flex;
-    align-items: center;
-    padding: 0.25rem 0.75rem;
-    border-radius: 3px;
-    font-size: 0.75rem;
-    font-weight: 500;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-}
-
-.status-completed {
-    background-color: #d4edda;
-    color: #155724;
-    border: 1px solid #c3e6cb;
-}
-
-.status-processing {
-    background-color: #fff3cd;
-    color: #856404;
-    border: 1px solid #ffeaa7;
-}
-
-.status-pending {
-    background-color: #f8f9fa;
-    color: #6c757d;
-    border: 1px solid #dee2e6;
-}
-
-/* Professional Entity Tags */
-.entity-tag {
-    display: inline-block;
-    padding: 0.125rem 0.5rem;
-    margin: 0.125rem;
-    border-radius: 3px;
-    font-size: 0.75rem;
-    font-weight: 500;
-    font-family: 'IBM Plex Mono', monospace;
-}
-
-.entity-symptom {
-    background-color: #e3f2fd;
-    color: #0d47a1;
-    border: 1px solid #bbdefb;
-}
-
-.entity-medication {
-    background-color: #e8f5e8;
-    color: #1b5e20;
-    border: 1px solid #c8e6c9;
-}
-
-.entity-condition {
-    background-color: #fff3e0;
-    color: #e65100;
-    border: 1px solid #ffcc02;
-}
-
-.entity-vital {
-    background-color: #f3e5f5;
-    color: #4a148c;
-    border: 1px solid #e1bee7;
-}
-
-/* Professional Buttons */
-.stButton > button {
-    border-radius: 4px;
-    border: 1px solid #0066cc;
-    padding: 0.5rem 1rem;
-    font-weight: 500;
-    font-size: 0.875rem;
-    background-color: #0066cc;
-    color: white;
-    transition: all 0.15s ease-in-out;
-}
-
-.stButton > button:hover {
-    background-color: #0052a3;
-    border-color: #0052a3;
-    box-shadow: 0 2px 4px rgba(0,102,204,0.25);
-}
-
-/* Professional Metrics */
-.metric-container {
-    background: #ffffff;
-    border: 1px solid #dee2e6;
-    border-radius: 4px;
-    padding: 1rem;
-    text-align: center;
-    margin-bottom: 1rem;
-}
-
-.metric-value {
-    font-size: 1.5rem;
-    font-weight: 600;
-    color: #0066cc;
-    margin-bottom: 0.25rem;
-}
-
-.metric-label {
-    font-size: 0.75rem;
-    color: #6c757d;
-    text-transform: uppercase;
-    letter-spacing: 0.5px;
-}
-
-/* Professional Progress */
-.progress-step {
-    display: flex;
-    align-items: center;
-    padding: 0.5rem 0;
-    font-size: 0.875rem;
-}
-
-.progress-step-number {
-    width: 24px;
-    height: 24px;
-    border-radius: 50%;
-    background-color: #f8f9fa;
-    border: 2px solid #dee2e6;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    font-size: 0.75rem;
-    font-weight: 600;
-    margin-right: 0.75rem;
-}
-
-.progress-step-number.active {
-    background-color: #0066cc;
-    border-color: #0066cc;
-    color: white;
-}
-
-.progress-step-number.completed {
-    background-color: #28a745;
-    border-color: #28a745;
-    color: white;
-}
-
-/* Professional Alerts */
-.alert-info {
-    background-color: #e7f3ff;
-    border: 1px solid #b3d9ff;
-    border-left: 4px solid #0066cc;
-    padding: 0.75rem 1rem;
-    border-radius: 4px;
-    color: #004085;
-    margin: 1rem 0;
-}
-
-/* Remove animations */
-* {
-    animation: none !important;
-    transition: all 0.15s ease-in-out;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# Mock professional classes
-class ProfessionalASR:
-    def __init__(self):
-        self.model_info = "OpenAI Whisper Base Model"
-    
-    def transcribe(self, audio_file):
-        # Professional progress indicator
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        stages = [
-            "Initializing audio processor...",
-            "Loading speech recognition model...",
-            "Processing audio signal...",
-            "Generating transcription..."
-        ]
-        
-        for i, stage in enumerate(stages):
-            status_text.text(stage)
-            for j in range(25):
-                time.sleep(0.005)
-                progress_bar.progress(i * 25 + j + 1)
-        
-        status_text.empty()
-        progress_bar.empty()
-        
-        return {
-            "text": "Good morning, Doctor. I've been experiencing chest pain for the past 24 hours. The pain is sharp, located in the center of my chest, and worsens with deep inspiration. I also noticed some shortness of breath and mild nausea this morning. I have no known allergies and am currently taking lisinopril 10mg daily for hypertension.",
-            "confidence": 0.89
-        }
-
-class ProfessionalNLP:
-    def extract_entities(self, text):
-        # Professional processing
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        stages = [
-            "Loading medical NLP models...",
-            "Tokenizing clinical text...",
-            "Identifying medical entities...",
-            "Calculating confidence scores..."
-        ]
-        
-        for i, stage in enumerate(stages):
-            status_text.text(stage)
-            for j in range(25):
-                time.sleep(0.005)
-                progress_bar.progress(i * 25 + j + 1)
-        
-        status_text.empty()
-        progress_bar.empty()
-        
-        return [
-            {"text": "chest pain", "label": "SYMPTOM", "confidence": 0.94, "start": 45, "end": 55},
-            {"text": "sharp", "label": "SYMPTOM", "confidence": 0.87, "start": 70, "end": 75},
-            {"text": "shortness of breath", "label": "SYMPTOM", "confidence": 0.91, "start": 180, "end": 199},
-            {"text": "nausea", "label": "SYMPTOM", "confidence": 0.85, "start": 210, "end": 216},
-            {"text": "lisinopril 10mg", "label": "MEDICATION", "confidence": 0.96, "start": 280, "end": 295},
-            {"text": "hypertension", "label": "CONDITION", "confidence": 0.93, "start": 310, "end": 322}
-        ]
-
-class ProfessionalSOAP:
-    def generate_note(self, transcription, entities):
-        # Professional generation
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        for i in range(100):
-            status_text.text(f"Generating clinical documentation... {i+1}%")
-            time.sleep(0.01)
-            progress_bar.progress(i + 1)
-        
-        status_text.empty()
-        progress_bar.empty()
-        
-        return {
-            "subjective": """Chief Complaint: Chest pain for 24 hours
+# Professional Enterprise CSS (static/demo_professional.css)
+# Emitted on every rerun (Streamlit drops elements a rerun does not write)
+st.markdown(load_css("demo_professional.css"), unsafe_allow_html=True)
+
+def show_stages(label, done_label, stages=()):
+    """Report processing stages in one collapsed status block."""
+    with st.status(label, expanded=False) as status:
+        for stage in stages:
+            st.write(stage)
+        status.update(label=done_label, state="complete")
+
+# Mock pipeline outputs, cached per input
+@st.cache_data(show_spinner=False)
+def _transcribe(audio_file):
+    """Mock speech recognition result."""
+    return {
+        "text": "Good morning, Doctor. I've been experiencing chest pain for the past 24 hours. The pain is sharp, located in the center of my chest, and worsens with deep inspiration. I also noticed some shortness of breath and mild nausea this morning. I have no known allergies and am currently taking lisinopril 10mg daily for hypertension.",
+        "confidence": 0.89
+    }
+
+@st.cache_data(show_spinner=False)
+def _extract_entities(text):
+    """Mock clinical entity extraction, cached per transcript."""
+    return [
+        {"text": "chest pain", "label": "SYMPTOM", "confidence": 0.94, "start": 45, "end": 55},
+        {"text": "sharp", "label": "SYMPTOM", "confidence": 0.87, "start": 70, "end": 75},
+        {"text": "shortness of breath", "label": "SYMPTOM", "confidence": 0.91, "start": 180, "end": 199},
+        {"text": "nausea", "label": "SYMPTOM", "confidence": 0.85, "start": 210, "end": 216},
+        {"text": "lisinopril 10mg", "label": "MEDICATION", "confidence": 0.96, "start": 280, "end": 295},
+        {"text": "hypertension", "label": "CONDITION", "confidence": 0.93, "start": 310, "end": 322}
+    ]
+
+@st.cache_data(show_spinner=False)
+def _generate_soap(transcription, entity_texts):
+    """Mock SOAP note, cached per transcript and entity set."""
+    return {
+        "subjective": """Chief Complaint: Chest pain for 24 hours
 
 History of Present Illness:
 Patient reports acute onset of chest pain beginning 24 hours ago. Pain is described as sharp, centrally located, and exacerbated by deep inspiration. Associated symptoms include dyspnea and nausea observed this morning. 
@@ -329,12 +62,12 @@ Past Medical History: Hypertension
 Current Medications: Lisinopril 10mg daily
 Allergies: No known drug allergies""",
 
-            "objective": """Vital Signs: [To be obtained]
+        "objective": """Vital Signs: [To be obtained]
 Physical Examination: [To be performed]
 Patient appears alert and cooperative
 No acute distress at rest""",
 
-            "assessment": """Primary Concerns:
+        "assessment": """Primary Concerns:
 1. Acute chest pain - differential diagnosis includes:
    - Pleuritic chest pain
    - Costochondritis  
@@ -342,7 +75,7 @@ No acute distress at rest""",
 2. Dyspnea - possibly related to chest pain
 3. Hypertension - stable on current medication""",
 
-            "plan": """Diagnostic Workup:
+        "plan": """Diagnostic Workup:
 - 12-lead ECG
 - Chest X-ray
 - Basic metabolic panel
@@ -357,100 +90,220 @@ Follow-up:
 - Primary care within 48 hours
 - Return if symptoms worsen
 - Continue current antihypertensive therapy"""
-        }
+    }
+
+@st.cache_data(show_spinner=False)
+def _build_export(transcription, entities, soap_note, started_at):
+    """Serialize the export once per payload."""
+    return json.dumps({
+        "transcription": transcription,
+        "entities": entities,
+        "soap_note": soap_note,
+        "timestamp": started_at.isoformat()
+    }, indent=2)
 
-# Initialize professional components
-if 'demo_step' not in st.session_state:
-    st.session_state.demo_step = 1
-if 'transcription' not in st.session_state:
-    st.session_state.transcription = ""
-if 'entities' not in st.session_state:
-    st.session_state.entities = []
-if 'soap_note' not in st.session_state:
-    st.session_state.soap_note = {}
-
-asr = ProfessionalASR()
-nlp = ProfessionalNLP()
-soap = ProfessionalSOAP()
+# Mock professional classes
+class ProfessionalASR:
+    def __init__(self):
+        self.model_info = "OpenAI Whisper Base Model"
+    
+    def transcribe(self, audio_file):
+        # Professional progress indicator
+        show_stages("Transcribing audio...", "Transcription complete", (
+            "Initializing audio processor...",
+            "Loading speech recognition model...",
+            "Processing audio signal...",
+            "Generating transcription..."
+        ))
+        
+        return _transcribe(audio_file)
 
-# Professional Header
-st.markdown("""
-<div class="header-container">
-    <h1 class="header-title">MediSynth Agent</h1>
-    <p class="header-subtitle">Clinical Documentation Assistant - Professional Demo</p>
-</div>
-""", unsafe_allow_html=True)
+class ProfessionalNLP:
+    def extract_entities(self, text):
+        # Professional processing
+        show_stages("Extracting clinical entities...", "Entity extraction complete", (
+            "Loading medical NLP models...",
+            "Tokenizing clinical text...",
+            "Identifying medical entities...",
+            "Calculating confidence scores..."
+        ))
+        
+        return _extract_entities(text)
 
-# System Status Dashboard
-col1, col2, col3, col4 = st.columns(4)
+class ProfessionalSOAP:
+    def generate_note(self, transcription, entities):
+        # Professional generation
+        show_stages("Generating clinical documentation...", "Clinical documentation generated")
+        
+        return _generate_soap(transcription, tuple(e["text"] for e in entities))
 
-with col1:
-    st.markdown("""
+# System status dashboard: four static cards in one grid
+STATUS_HTML = """
+<div class="metrics-row">
     <div class="metric-container">
         <div class="metric-value">ASR</div>
         <div class="metric-label">Speech Recognition</div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown("""
     <div class="metric-container">
         <div class="metric-value">NLP</div>
         <div class="metric-label">Entity Extraction</div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown("""
     <div class="metric-container">
         <div class="metric-value">SOAP</div>
         <div class="metric-label">Note Generation</div>
     </div>
-    """, unsafe_allow_html=True)
-
-with col4:
-    st.markdown("""
     <div class="metric-container">
         <div class="metric-value">Ready</div>
         <div class="metric-label">System Status</div>
     </div>
-    """, unsafe_allow_html=True)
-
-# Workflow Progress
-st.markdown("""
-<div class="clinical-card">
-    <div class="clinical-card-header">Workflow Status</div>
 </div>
-""", unsafe_allow_html=True)
+"""
 
-steps = [
+# Workflow steps shown in the status tracker
+WORKFLOW_STEPS = (
     {"num": 1, "title": "Audio Input", "status": "Upload audio file"},
     {"num": 2, "title": "Transcription", "status": "Speech-to-text processing"},
     {"num": 3, "title": "Entity Extraction", "status": "Medical entity identification"},
     {"num": 4, "title": "SOAP Generation", "status": "Clinical note creation"},
     {"num": 5, "title": "Documentation", "status": "Export and review"}
-]
-
-for step in steps:
-    status_class = ""
-    if step["num"] < st.session_state.demo_step:
-        status_class = "completed"
-    elif step["num"] == st.session_state.demo_step:
-        status_class = "active"
-    else:
-        status_class = "pending"
+)
+
+@st.cache_data(show_spinner=False)
+def render_steps_html(current_step):
+    """Build the whole workflow tracker for the current step as one HTML block."""
+    rows = []
+    for step in WORKFLOW_STEPS:
+        if step["num"] < current_step:
+            status_class = "completed"
+        elif step["num"] == current_step:
+            status_class = "active"
+        else:
+            status_class = "pending"
+        rows.append(
+            f'<div class="progress-step"><div class="progress-step-number {status_class}">{step["num"]}</div>'
+            f'<div><strong>{step["title"]}</strong><br><small style="color: #6c757d;">{step["status"]}</small></div></div>'
+        )
+    return "".join(rows)
+
+@st.cache_data(show_spinner=False)
+def render_entities_html(entities_key):
+    """Build the grouped entity tags for a tuple of (text, label, confidence)."""
+    groups = defaultdict(list)
+    for entity in entities_key:
+        groups[entity[1]].append(entity)
     
-    st.markdown(f"""
-    <div class="progress-step">
-        <div class="progress-step-number {status_class}">
-            {step["num"]}
-        </div>
-        <div>
-            <strong>{step["title"]}</strong><br>
-            <small style="color: #6c757d;">{step["status"]}</small>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    html = []
+    for entity_type in ["SYMPTOM", "MEDICATION", "CONDITION"]:
+        type_entities = groups.get(entity_type)
+        if type_entities:
+            css_class = f"entity-{entity_type.lower()}"
+            html.append(f"<p><strong>{entity_type.title()}s:</strong></p><div>")
+            html.append(" ".join(
+                f'<span class="entity-tag {css_class}" title="Confidence: {confidence:.1%}">{text}</span>'
+                for text, label, confidence in type_entities
+            ))
+            html.append("</div>")
+    return "".join(html)
+
+# Initialize professional components
+SESSION_DEFAULTS = {
+    "demo_step": 1,
+    "transcription": "",
+    "entities": [],
+    "soap_note": {}
+}
+
+for key, value in SESSION_DEFAULTS.items():
+    st.session_state.setdefault(key, value)
+if "session_started_at" not in st.session_state:
+    st.session_state.session_started_at = datetime.now()
+
+def reset_demo():
+    """Return the demo to step 1; used as the reset button callback."""
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state[key] = value
+    st.session_state.session_started_at = datetime.now()
+
+# Initialize processors once per server process
+@st.cache_resource
+def get_asr():
+    return ProfessionalASR()
+
+@st.cache_resource
+def get_nlp():
+    return ProfessionalNLP()
+
+@st.cache_resource
+def get_soap():
+    return ProfessionalSOAP()
+
+asr = get_asr()
+nlp = get_nlp()
+soap = get_soap()
+
+# st.fragment needs Streamlit 1.37; older releases rerun the whole script instead
+fragment = getattr(st, "fragment", lambda func: func)
+
+SOAP_SECTIONS = (
+    ("subjective", "SUBJECTIVE"),
+    ("objective", "OBJECTIVE"),
+    ("assessment", "ASSESSMENT"),
+    ("plan", "PLAN"),
+)
+
+@fragment
+def soap_editor():
+    """SOAP section text areas; edits rerun only this block."""
+    note = st.session_state.soap_note
+    for key, title in SOAP_SECTIONS:
+        text = note.get(key)
+        if text is not None:
+            st.markdown(f"**{title}**")
+            st.text_area(
+                f"{title} Section",
+                value=text,
+                height=100,
+                key=f"soap_{key}",
+                label_visibility="collapsed"
+            )
+
+@fragment
+def export_actions():
+    """Export buttons; clicks rerun only this block."""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("Export PDF", type="primary", use_container_width=True):
+            st.success("✓ PDF documentation exported")
+    
+    with col2:
+        if st.button("Export JSON", type="secondary", use_container_width=True):
+            st.json(_build_export(
+                st.session_state.transcription,
+                st.session_state.entities,
+                st.session_state.soap_note,
+                st.session_state.session_started_at
+            ))
+
+# Professional Header
+st.markdown("""
+<div class="header-container">
+    <h1 class="header-title">MediSynth Agent</h1>
+    <p class="header-subtitle">Clinical Documentation Assistant - Professional Demo</p>
+</div>
+""", unsafe_allow_html=True)
+
+# System Status Dashboard
+st.markdown(STATUS_HTML, unsafe_allow_html=True)
+
+# Workflow Progress
+st.markdown("""
+<div class="clinical-card">
+    <div class="clinical-card-header">Workflow Status</div>
+</div>
+""", unsafe_allow_html=True)
+
+st.markdown(render_steps_html(st.session_state.demo_step), unsafe_allow_html=True)
 
 # Step 1: Audio Input
 st.markdown("""
@@ -510,37 +363,19 @@ if st.session_state.demo_step >= 3:
         """, unsafe_allow_html=True)
         
         # Entity counts
-        entity_counts = {}
-        for entity in st.session_state.entities:
-            label = entity["label"]
-            entity_counts[label] = entity_counts.get(label, 0) + 1
+        entity_counts = Counter(entity["label"] for entity in st.session_state.entities)
         
-        cols = st.columns(len(entity_counts))
-        for i, (label, count) in enumerate(entity_counts.items()):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="metric-container">
-                    <div class="metric-value">{count}</div>
-                    <div class="metric-label">{label.title()}</div>
-                </div>
-                """, unsafe_allow_html=True)
+        cells = [
+            f'<div class="metric-container"><div class="metric-value">{count}</div>'
+            f'<div class="metric-label">{label.title()}</div></div>'
+            for label, count in entity_counts.items()
+        ]
+        for col, html in zip(st.columns(len(cells)), cells):
+            col.markdown(html, unsafe_allow_html=True)
         
         # Professional entity tags
-        for entity_type in ["SYMPTOM", "MEDICATION", "CONDITION"]:
-            type_entities = [e for e in st.session_state.entities if e["label"] == entity_type]
-            if type_entities:
-                st.markdown(f"**{entity_type.title()}s:**")
-                tags_html = ""
-                for entity in type_entities:
-                    css_class = f"entity-{entity_type.lower()}"
-                    tags_html += f"""
-                    <span class="entity-tag {css_class}" 
-                          title="Confidence: {entity['confidence']:.1%}">
-                        {entity['text']}
-                    </span>
-                    """
-                st.markdown(tags_html, unsafe_allow_html=True)
-                st.write("")
+        entities_key = tuple((e["text"], e["label"], e["confidence"]) for e in st.session_state.entities)
+        st.markdown(render_entities_html(entities_key), unsafe_allow_html=True)
 
 # Step 4: SOAP Generation
 if st.session_state.demo_step >= 4:
@@ -565,24 +400,7 @@ if st.session_state.demo_step >= 4:
         </div>
         """, unsafe_allow_html=True)
         
-        # Professional SOAP display
-        sections = [
-            ("subjective", "SUBJECTIVE"),
-            ("objective", "OBJECTIVE"), 
-            ("assessment", "ASSESSMENT"),
-            ("plan", "PLAN")
-        ]
-        
-        for key, title in sections:
-            if key in st.session_state.soap_note:
-                st.markdown(f"**{title}**")
-                st.text_area(
-                    f"{title} Section",
-                    value=st.session_state.soap_note[key],
-                    height=100,
-                    key=f"soap_{key}",
-                    label_visibility="collapsed"
-                )
+        soap_editor()
 
 # Step 5: Export
 if st.session_state.demo_step >= 5:
@@ -592,29 +410,13 @@ if st.session_state.demo_step >= 5:
     </div>
     """, unsafe_allow_html=True)
     
-    col1, col2, col3 = st.columns(3)
+    col1, col2 = st.columns([2, 1])
     
     with col1:
-        if st.button("Export PDF", type="primary", use_container_width=True):
-            st.success("✓ PDF documentation exported")
+        export_actions()
     
     with col2:
-        if st.button("Export JSON", type="secondary", use_container_width=True):
-            export_data = {
-                "transcription": st.session_state.transcription,
-                "entities": st.session_state.entities,
-                "soap_note": st.session_state.soap_note,
-                "timestamp": datetime.now().isoformat()
-            }
-            st.json(export_data)
-    
-    with col3:
-        if st.button("Reset Demo", use_container_width=True):
-            st.session_state.demo_step = 1
-            st.session_state.transcription = ""
-            st.session_state.entities = []
-            st.session_state.soap_note = {}
-            st.rerun()
+        st.button("Reset Demo", use_container_width=True, on_click=reset_demo)
 
 # Professional Footer
 st.markdown("""
@@ -40,9 +40,9 @@ def download_models():
     
     try:
         # Download Whisper model
-        import whisper
+        from faster_whisper import WhisperModel
         print("📥 Downloading Whisper model...")
-        whisper.load_model("base")
+        WhisperModel("base", device="cpu", compute_type="int8")
         print("✅ Whisper model downloaded!")
         
         # Download medical NER model (will be cached on first use)
@@ -99,8 +99,8 @@ def run_tests():
         import streamlit
         print("✅ Streamlit imported")
         
-        import whisper
-        print("✅ Whisper imported")
+        import faster_whisper
+        print("✅ faster-whisper imported")
         
         import transformers
         print("✅ Transformers imported")
@@ -0,0 +1,62 @@
+"""
+Shared stylesheet loading for the Streamlit demos.
+"""
+
+import re
+from pathlib import Path
+
+import streamlit as st
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+FONT_PRECONNECT = (
+    '<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+)
+
+
+def font_links(families):
+    """
+    Build the Google Fonts link tags for a demo.
+    
+    Args:
+        families: Google Fonts css2 family specs, e.g. "Inter:wght@400;600"
+    
+    Returns:
+        Preconnect hints followed by one stylesheet link for all families
+    """
+    query = "&".join(f"family={family}" for family in families)
+    return (
+        FONT_PRECONNECT
+        + f'<link rel="stylesheet" href="https://fonts.googleapis.com/css2?{query}&display=swap">'
+    )
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+@st.cache_resource
+def load_css(name, fonts=()):
+    """
+    Read and minify a stylesheet under static/ once per server process.
+    
+    The result still has to be written with st.markdown on every rerun
+    (Streamlit drops elements a rerun does not write); only building the
+    payload is cached.
+    
+    Args:
+        name: Stylesheet file name under static/
+        fonts: Google Fonts family specs to link ahead of the stylesheet
+    
+    Returns:
+        HTML with the font links (if any) and an inline <style> block
+    """
+    css = minify_css((STATIC_DIR / name).read_text(encoding="utf-8"))
+    links = font_links(fonts) if fonts else ""
+    return f"{links}\n<style>{css}</style>"
@@ -67,8 +67,8 @@ def test_with_dependencies():
     try:
         # Test Whisper availability
         print("🎙️ Testing Whisper...")
-        import whisper
-        model = whisper.load_model("tiny")
+        from faster_whisper import WhisperModel
+        model = WhisperModel("tiny", device="cpu", compute_type="int8")
         print("✅ Whisper available")
         
         # Test transformers
@@ -0,0 +1,127 @@
+"""
+Unit tests for the MediSynth ASR processor.
+
+Kept apart from test_medisynth.py so they run without the NLP
+dependencies (spaCy) installed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    import numpy as np
+    import asr
+    from asr import create_asr_processor
+except ImportError:
+    pytest.skip("Dependencies not installed", allow_module_level=True)
+
+
+SEGMENT = SimpleNamespace(
+    id=0, start=0.0, end=45.0, text=" Patient reports chest pain.",
+    avg_logprob=-0.1, no_speech_prob=0.01
+)
+
+
+class StubModel:
+    """Stand-in WhisperModel recording its transcribe calls."""
+    
+    def __init__(self, *args, **kwargs):
+        self.calls = []
+    
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        return iter([SEGMENT]), SimpleNamespace(language="en")
+
+
+@pytest.fixture
+def stub_whisper(monkeypatch):
+    """Load StubModel instead of Whisper weights behind the real model cache."""
+    faster_whisper = pytest.importorskip("faster_whisper")
+    monkeypatch.setattr(faster_whisper, "WhisperModel", StubModel)
+    asr._cached_whisper.cache_clear()
+    yield
+    asr._cached_whisper.cache_clear()
+
+
+class TestASRProcessor:
+    """Test ASR functionality."""
+    
+    def test_asr_processor_creation(self):
+        """Test ASR processor can be created."""
+        processor = create_asr_processor(model_size="tiny")
+        assert processor is not None
+        assert processor.model_size == "tiny"
+        assert processor.compute_type == "int8"
+    
+    def test_asr_model_shared_across_processors(self, stub_whisper):
+        """Test processors with the same configuration reuse one model."""
+        first = create_asr_processor(model_size="tiny")
+        second = create_asr_processor(model_size="tiny")
+        assert first.model is second.model
+    
+    def test_audio_preprocessing(self, stub_whisper):
+        """Test audio preprocessing."""
+        processor = create_asr_processor(model_size="tiny")
+        
+        # Create dummy audio data
+        dummy_audio = np.random.randn(16000)  # 1 second of audio
+        
+        processed = processor.preprocess_audio(dummy_audio)
+        assert len(processed) > 0
+        assert isinstance(processed, np.ndarray)
+    
+    def test_confidence_score_from_logprob(self, stub_whisper):
+        """Test confidence is averaged from segment avg_logprob."""
+        import math
+        processor = create_asr_processor(model_size="tiny")
+        
+        result = {"segments": [{"avg_logprob": 0.0}, {"avg_logprob": math.log(0.5)}]}
+        
+        assert processor.get_confidence_score(result) == pytest.approx(0.75)
+        assert processor.get_confidence_score({"segments": []}) == 0.0
+
+
+class TestTranscribeBatch:
+    """Test batch transcription without loading Whisper weights."""
+    
+    def test_without_vad_decodes_long_audio_sequentially(self, stub_whisper):
+        """Test VAD off sends audio over 30 s through the sequential model."""
+        processor = asr.ASRProcessor(vad_filter=False)
+        stub_model = processor.model
+        audio = np.random.randn(45 * 16000).astype(np.float32)
+        
+        results = processor.transcribe_batch([audio, audio])
+        
+        assert [r["text"] for r in results] == ["Patient reports chest pain."] * 2
+        assert [call["vad_filter"] for call in stub_model.calls] == [False, False]
+        assert processor._batched_pipeline is None
+    
+    def test_with_vad_builds_pipeline_once(self, stub_whisper, monkeypatch):
+        """Test VAD on builds one batched pipeline and calls it per input."""
+        faster_whisper = pytest.importorskip("faster_whisper")
+        
+        class StubPipeline:
+            instances = 0
+            
+            def __init__(self, model):
+                assert model is stub_model
+                StubPipeline.instances += 1
+                self.calls = []
+            
+            def transcribe(self, audio, **kwargs):
+                self.calls.append(kwargs)
+                return iter([SEGMENT]), SimpleNamespace(language="en")
+        
+        monkeypatch.setattr(faster_whisper, "BatchedInferencePipeline", StubPipeline)
+        processor = asr.ASRProcessor(vad_filter=True)
+        stub_model = processor.model
+        audio = np.random.randn(45 * 16000).astype(np.float32)
+        
+        processor.transcribe_batch([audio, audio, audio])
+        processor.transcribe_batch([audio])
+        
+        assert StubPipeline.instances == 1
+        assert len(processor._batched_pipeline.calls) == 4
+        assert all(call["vad_filter"] for call in processor._batched_pipeline.calls)
+        assert stub_model.calls == []
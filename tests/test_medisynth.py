@@ -9,7 +9,6 @@ from pathlib import Path
 
 # Import modules to test
 try:
-    from asr import create_asr_processor
     from nlp import create_clinical_processor
     from nlp.soap_generator import create_soap_generator
     from utils import create_file_handler, create_document_exporter
@@ -17,28 +16,6 @@ except ImportError:
     pytest.skip("Dependencies not installed", allow_module_level=True)
 
 
-class TestASRProcessor:
-    """Test ASR functionality."""
-    
-    def test_asr_processor_creation(self):
-        """Test ASR processor can be created."""
-        processor = create_asr_processor(model_size="tiny")
-        assert processor is not None
-        assert processor.model_size == "tiny"
-    
-    def test_audio_preprocessing(self):
-        """Test audio preprocessing."""
-        processor = create_asr_processor(model_size="tiny")
-        
-        # Create dummy audio data
-        import numpy as np
-        dummy_audio = np.random.randn(16000)  # 1 second of audio
-        
-        processed = processor.preprocess_audio(dummy_audio)
-        assert len(processed) > 0
-        assert isinstance(processed, np.ndarray)
-
-
 class TestClinicalProcessor:
     """Test clinical NLP functionality."""
     
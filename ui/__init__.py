@@ -59,6 +59,12 @@ def check_ffmpeg_installed():
         return False
 
 
+@st.cache_resource
+def get_asr_processor():
+    """Create the ASR processor once and share it across reruns and sessions."""
+    return create_asr_processor()
+
+
 class EHRDatabase:
     """Electronic Health Record Database Management"""
     
@@ -1180,11 +1186,13 @@ class MediSynthUI:
                 entity_type = entity.get('type', 'Unknown')
                 entity_counts[entity_type] = entity_counts.get(entity_type, 0) + 1
             
-            # Display as metrics
-            if entity_counts:
-                cols = st.columns(len(entity_counts))
-                for i, (entity_type, count) in enumerate(entity_counts.items()):
-                    with cols[i]:
+            # Display as metrics in fixed four-column rows so the layout is
+            # stable across reruns regardless of how many types were found
+            items = list(entity_counts.items())
+            for row_start in range(0, len(items), 4):
+                cols = st.columns(4)
+                for col, (entity_type, count) in zip(cols, items[row_start:row_start + 4]):
+                    with col:
                         st.metric(entity_type, count)
             
             # Entity table
@@ -1194,11 +1202,10 @@ class MediSynthUI:
             
             # Entity tags display
             st.markdown("##### 🏷️ Entity Tags")
-            entity_html = ""
-            for entity in st.session_state.clinical_entities:
-                entity_text = entity.get('text', '')
-                entity_type = entity.get('type', 'Unknown')
-                entity_html += f'<span class="entity-tag" title="{entity_type}">{entity_text}</span>'
+            entity_html = "".join(
+                f'<span class="entity-tag" title="{entity.get("type", "Unknown")}">{entity.get("text", "")}</span>'
+                for entity in st.session_state.clinical_entities
+            )
             
             st.markdown(entity_html, unsafe_allow_html=True)
         
@@ -1379,7 +1386,7 @@ class MediSynthUI:
             # Initialize ASR processor if needed
             if not self.asr_processor:
                 with st.spinner("🔧 Initializing ASR processor..."):
-                    self.asr_processor = create_asr_processor()
+                    self.asr_processor = get_asr_processor()
             
             # Create progress tracking
             progress_bar = st.progress(0)